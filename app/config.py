@@ -74,6 +74,11 @@ class Config:
     LYRICS_MAX_DOWNLOAD_MB = int(os.environ.get('LYRICS_MAX_DOWNLOAD_MB', '30'))
     LYRICS_EXTRACTION_ASYNC_ENABLED = os.environ.get('LYRICS_EXTRACTION_ASYNC_ENABLED', 'true').lower() == 'true'
     LYRICS_EXTRACTION_WORKERS = int(os.environ.get('LYRICS_EXTRACTION_WORKERS', '2'))
+    LYRICS_RESULT_CACHE_ENABLED = os.environ.get('LYRICS_RESULT_CACHE_ENABLED', 'true').lower() == 'true'
+    LYRICS_RESULT_CACHE_SIZE = int(os.environ.get('LYRICS_RESULT_CACHE_SIZE', '256'))
+    LYRICS_RESULT_CACHE_TTL_SECONDS = int(os.environ.get('LYRICS_RESULT_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+    LYRICS_CACHE_MEMORY_TTL_SECONDS = int(os.environ.get('LYRICS_CACHE_MEMORY_TTL_SECONDS', '600'))
+    LYRICS_CACHE_MEMORY_SIZE = int(os.environ.get('LYRICS_CACHE_MEMORY_SIZE', '1024'))
     
     # AssemblyAI (Tier 3)
     ASSEMBLYAI_API_KEY = os.environ.get('ASSEMBLYAI_API_KEY', '')
@@ -186,6 +191,11 @@ class Config:
         app.config['LYRICS_MAX_DOWNLOAD_MB'] = cls.LYRICS_MAX_DOWNLOAD_MB
         app.config['LYRICS_EXTRACTION_ASYNC_ENABLED'] = cls.LYRICS_EXTRACTION_ASYNC_ENABLED
         app.config['LYRICS_EXTRACTION_WORKERS'] = cls.LYRICS_EXTRACTION_WORKERS
+        app.config['LYRICS_RESULT_CACHE_ENABLED'] = cls.LYRICS_RESULT_CACHE_ENABLED
+        app.config['LYRICS_RESULT_CACHE_SIZE'] = cls.LYRICS_RESULT_CACHE_SIZE
+        app.config['LYRICS_RESULT_CACHE_TTL_SECONDS'] = cls.LYRICS_RESULT_CACHE_TTL_SECONDS
+        app.config['LYRICS_CACHE_MEMORY_TTL_SECONDS'] = cls.LYRICS_CACHE_MEMORY_TTL_SECONDS
+        app.config['LYRICS_CACHE_MEMORY_SIZE'] = cls.LYRICS_CACHE_MEMORY_SIZE
         
         # AssemblyAI configuration
         app.config['ASSEMBLYAI_API_KEY'] = cls.ASSEMBLYAI_API_KEY
@@ -7,6 +7,8 @@ import uuid
 import datetime
 import json
 import logging
+import stat
+import tempfile
 from typing import Dict, Any, List, Optional
 from werkzeug.utils import secure_filename
 
@@ -213,24 +215,52 @@ class JSONUtils:
             return default if default is not None else []
     
     @staticmethod
-    def save_json_file(file_path: str, data: Any) -> bool:
+    def save_json_file(file_path: str, data: Any, durable: bool = True) -> bool:
         """
         Save data to JSON file.
         
+        The data is written to a temporary sibling file which then atomically
+        replaces the target, so readers never observe a partially written file.
+        
         Args:
             file_path: Path to JSON file
             data: Data to save
+            durable: fsync the temporary file before replacing the target.
+                High-frequency callers can pass False to skip the fsync cost.
             
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = None
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # A unique temp file per call, so concurrent saves never share one
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(file_path) or '.',
+                prefix=os.path.basename(file_path) + '.'
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, default=str)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # mkstemp creates the file 0600; keep the permissions of the file being replaced
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, file_path)
+            tmp_path = None
             return True
-        except IOError as e:
+        except (IOError, OSError) as e:
             logger.error(f"Error saving JSON file {file_path}: {e}")
             return False
+        finally:
+            # Never leave a partial temp file behind, whatever the failure
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
 
 class URLUtils:
@@ -56,6 +56,17 @@ MIN_WORDS_BEFORE_UPPER_BREAK = int(os.getenv("LYRICS_MIN_WORDS_BEFORE_UPPER_BREA
 # Concurrency
 MAX_CONCURRENT_JOBS = int(os.getenv("LYRICS_MAX_CONCURRENT_JOBS", "1"))
 
+# Job event polling (SSE endpoint): exponential backoff between Redis polls
+EVENTS_POLL_INTERVAL = float(os.getenv("LYRICS_EVENTS_POLL_INTERVAL", "1.0"))
+EVENTS_POLL_MAX_INTERVAL = float(os.getenv("LYRICS_EVENTS_POLL_MAX_INTERVAL", "15.0"))
+EVENTS_POLL_BACKOFF = float(os.getenv("LYRICS_EVENTS_POLL_BACKOFF", "1.5"))
+
+# Retry-After hint (seconds) returned to clients polling an unfinished job
+STATUS_RETRY_AFTER = int(os.getenv("LYRICS_STATUS_RETRY_AFTER", "2"))
+# Long-poll: maximum seconds a status request may hold waiting for completion
+STATUS_MAX_WAIT = int(os.getenv("LYRICS_STATUS_MAX_WAIT", "30"))
+STATUS_WAIT_POLL_INTERVAL = float(os.getenv("LYRICS_STATUS_WAIT_POLL_INTERVAL", "0.5"))
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
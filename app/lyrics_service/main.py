@@ -2,8 +2,10 @@
 FastAPI application for lyrics extraction service.
 Provides async job-based API for extracting lyrics from audio.
 """
+import asyncio
 import logging
 import os
+import random
 import shutil
 import uuid
 from pathlib import Path
@@ -11,11 +13,12 @@ from typing import Optional, Literal
 
 import redis
 import json
-import time
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, status
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from rq import Queue
+from rq.exceptions import NoSuchJobError
 from rq.job import Job
 
 from app.lyrics_service import config
@@ -62,6 +65,35 @@ class HealthResponse(BaseModel):
     queue_size: int
 
 
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _save_upload(source, dest_path: str) -> Optional[int]:
+    """
+    Copy an uploaded file object to dest_path in large chunks.
+    
+    Returns:
+        Number of bytes written, or None if the upload exceeded the size limit
+    """
+    total_size = 0
+    with open(dest_path, "wb") as f:
+        while True:
+            chunk = source.read(UPLOAD_COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            total_size += len(chunk)
+            if total_size > config.MAX_UPLOAD_SIZE_BYTES:
+                return None
+            f.write(chunk)
+    return total_size
+
+
+def _fetch_job_status(job_id: str):
+    """Fetch a job and its status; both hit Redis, so call via run_in_threadpool."""
+    job = Job.fetch(job_id, connection=redis_conn)
+    return job, job.get_status()
+
+
 # API Routes
 
 @app.get("/healthz", response_model=HealthResponse)
@@ -127,25 +159,14 @@ async def create_lyrics_extraction_job(
     temp_file_path = os.path.join(config.TEMP_DIR, f"{job_id}{file_ext}")
     
     try:
-        # Check file size while uploading
-        total_size = 0
-        with open(temp_file_path, "wb") as f:
-            while True:
-                chunk = await file.read(8192)
-                if not chunk:
-                    break
-                total_size += len(chunk)
-                
-                if total_size > config.MAX_UPLOAD_SIZE_BYTES:
-                    # Cleanup and reject
-                    f.close()
-                    os.remove(temp_file_path)
-                    raise HTTPException(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail=f"File size exceeds {config.MAX_UPLOAD_SIZE_MB}MB limit"
-                    )
-                
-                f.write(chunk)
+        # Stream the spooled upload to disk off the event loop, checking size as we go
+        total_size = await run_in_threadpool(_save_upload, file.file, temp_file_path)
+        if total_size is None:
+            os.remove(temp_file_path)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File size exceeds {config.MAX_UPLOAD_SIZE_MB}MB limit"
+            )
         
         logger.info(f"[{job_id}] Uploaded file saved: {temp_file_path} ({total_size} bytes)")
         
@@ -187,8 +208,28 @@ async def create_lyrics_extraction_job(
         )
 
 
+async def _wait_for_job_completion(job_id: str, timeout: float) -> None:
+    """Hold until the job leaves the queued/started states or timeout elapses."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        try:
+            _, job_status = await run_in_threadpool(_fetch_job_status, job_id)
+            if job_status not in ("queued", "started"):
+                return
+        except (NoSuchJobError, redis.exceptions.RedisError) as e:
+            # Stop holding the request; the status lookup that follows reports it
+            logger.warning(f"Job {job_id}: long-poll stopped early: {e}")
+            return
+        await asyncio.sleep(config.STATUS_WAIT_POLL_INTERVAL)
+
+
 @app.get(f"{config.API_PREFIX}/lyrics/{{job_id}}", response_model=JobResponse)
-async def get_lyrics_job_status(job_id: str):
+async def get_lyrics_job_status(
+    job_id: str,
+    response: Response,
+    wait: int = Query(0, ge=0, description="Long-poll: seconds to wait for the job to finish")
+):
     """
     Get the status and result of a lyrics extraction job.
     
@@ -198,7 +239,14 @@ async def get_lyrics_job_status(job_id: str):
     - done: Job completed successfully (result available)
     - error: Job failed (error details available)
     - not_found: Job ID not found or expired
+    
+    Unfinished jobs carry a Retry-After header telling clients when to poll next.
+    With ?wait=N the request is held (up to LYRICS_STATUS_MAX_WAIT seconds)
+    until the job finishes, so one request replaces many short polls.
     """
+    if wait:
+        await _wait_for_job_completion(job_id, min(wait, config.STATUS_MAX_WAIT))
+    
     try:
         # Fetch job from RQ
         job = Job.fetch(job_id, connection=redis_conn)
@@ -206,6 +254,9 @@ async def get_lyrics_job_status(job_id: str):
         # Map RQ status to our status
         rq_status = job.get_status()
         
+        if rq_status in ("queued", "started"):
+            response.headers["Retry-After"] = str(config.STATUS_RETRY_AFTER)
+        
         if rq_status == "queued":
             meta = job.meta.copy() if getattr(job, 'meta', None) else {}
             meta.update({"queue_position": queue.job_ids.index(job_id) + 1 if job_id in queue.job_ids else None})
@@ -289,23 +340,27 @@ async def get_lyrics_job_status(job_id: str):
 @app.get(f"{config.API_PREFIX}/lyrics/{{job_id}}/events")
 async def lyrics_job_events(job_id: str):
     """Server-sent events endpoint streaming job progress and status."""
-    def event_stream():
+    async def event_stream():
         last_meta = None
+        current_delay = config.EVENTS_POLL_INTERVAL
         while True:
             try:
-                job = Job.fetch(job_id, connection=redis_conn)
-                status = job.get_status()
+                job, status = await run_in_threadpool(_fetch_job_status, job_id)
                 meta = job.meta or {}
                 payload = {"job_id": job_id, "status": status, "meta": meta}
                 if meta != last_meta:
                     yield f"data: {json.dumps(payload)}\n\n"
                     last_meta = dict(meta)
+                    # Progress moved: go back to the fast cadence
+                    current_delay = config.EVENTS_POLL_INTERVAL
                 if status in ("finished", "failed"):
                     break
             except Exception:
                 yield f"data: {json.dumps({'job_id': job_id, 'status': 'not_found'})}\n\n"
                 break
-            time.sleep(1)
+            # Back off while nothing changes; jitter de-synchronizes concurrent streams
+            await asyncio.sleep(current_delay + random.uniform(0, current_delay * 0.1))
+            current_delay = min(current_delay * config.EVENTS_POLL_BACKOFF, config.EVENTS_POLL_MAX_INTERVAL)
     return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
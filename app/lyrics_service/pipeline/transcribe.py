@@ -3,7 +3,9 @@ Speech-to-text transcription module using faster-whisper.
 Optimized for singing voice with Vietnamese/English mixed support.
 """
 import logging
-from typing import Dict, List, Optional, Literal
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Literal, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,46 @@ except ImportError:
 
 LanguageCode = Literal["en", "vi", "auto"]
 
+# Loaded models are expensive (seconds to load, GBs of memory), so keep the
+# most recently used ones around for subsequent jobs in the same process.
+MAX_CACHED_MODELS = 2
+_model_cache: "OrderedDict[Tuple[str, str, str, int], Any]" = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def get_whisper_model(model_size: str, device: str, compute_type: str, num_workers: int = 1):
+    """
+    Return a loaded WhisperModel, reusing a cached instance when available.
+    
+    Args:
+        model_size: Whisper model size
+        device: 'cpu' or 'cuda'
+        compute_type: Compute type for inference
+        num_workers: Number of parallel workers for CPU inference
+    
+    Returns:
+        Loaded WhisperModel instance
+    """
+    key = (model_size, device, compute_type, num_workers)
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+            return model
+        
+        logger.info(f"Loading Whisper model: {model_size} on {device} with {compute_type}")
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            num_workers=num_workers
+        )
+        _model_cache[key] = model
+        while len(_model_cache) > MAX_CACHED_MODELS:
+            evicted_key, _ = _model_cache.popitem(last=False)
+            logger.info(f"Evicted cached Whisper model: {evicted_key[0]}")
+        return model
+
 
 class LyricsTranscriber:
     """Wrapper for faster-whisper transcription tuned for singing."""
@@ -46,16 +88,9 @@ class LyricsTranscriber:
         self.compute_type = compute_type
         self.num_workers = num_workers
         
-        logger.info(f"Loading Whisper model: {model_size} on {device} with {compute_type}")
-        
         try:
-            self.model = WhisperModel(
-                model_size,
-                device=device,
-                compute_type=compute_type,
-                num_workers=num_workers
-            )
-            logger.info("Whisper model loaded successfully")
+            self.model = get_whisper_model(model_size, device, compute_type, num_workers)
+            logger.info("Whisper model ready")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
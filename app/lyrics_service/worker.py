@@ -6,6 +6,7 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -22,6 +23,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Single background thread used to warm the Whisper model while the job is
+# still preprocessing / separating audio.
+_model_prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-prefetch")
+
 
 def process_lyrics_extraction(
     job_id: str,
@@ -64,6 +69,7 @@ def process_lyrics_extraction(
     }
 
     temp_manager = None
+    model_future = None
 
     # RQ job progress reporting helper
     job = get_current_job()
@@ -92,6 +98,17 @@ def process_lyrics_extraction(
 
         set_progress(5, 'validated')
 
+        # Load the Whisper model in the background so it overlaps with
+        # ffmpeg preprocessing and Demucs separation below.
+        if transcribe.FASTER_WHISPER_AVAILABLE:
+            model_future = _model_prefetch_executor.submit(
+                transcribe.get_whisper_model,
+                config.WHISPER_MODEL_SIZE,
+                config.DEVICE,
+                config.COMPUTE_TYPE,
+                1
+            )
+
         # Get audio duration
         duration = utils.get_audio_duration(audio_file_path)
         if duration:
@@ -151,6 +168,13 @@ def process_lyrics_extraction(
         # The include_timestamps parameter only controls whether we *return* them to the caller.
         word_timestamps = True
 
+        if model_future is not None:
+            try:
+                model_future.result()
+            except Exception as e:
+                # LyricsTranscriber retries the load and reports the error
+                logger.warning(f"[{job_id}] Background Whisper model load failed: {e}")
+
         transcriber = transcribe.LyricsTranscriber(
             model_size=config.WHISPER_MODEL_SIZE,
             device=config.DEVICE,
@@ -239,7 +263,7 @@ def process_lyrics_extraction(
 if __name__ == "__main__":
     """Run RQ worker."""
     import redis
-    from rq import Worker, Queue, Connection
+    from rq import SimpleWorker, Queue, Connection
     
     logger.info("Starting RQ worker for lyrics extraction")
     logger.info(f"Redis: {config.REDIS_HOST}:{config.REDIS_PORT}/{config.REDIS_DB}")
@@ -254,8 +278,10 @@ if __name__ == "__main__":
     # Create queue
     queue = Queue(config.QUEUE_NAME, connection=redis_conn)
 
-    # Start worker
+    # Start worker. SimpleWorker runs jobs in this process instead of a forked
+    # child per job, so the Whisper model cache in transcribe survives between
+    # jobs (and a CUDA context is never carried across fork()).
     with Connection(redis_conn):
-        worker = Worker([queue], name=f"{config.SERVICE_NAME}-worker-{os.getpid()}")
+        worker = SimpleWorker([queue], name=f"{config.SERVICE_NAME}-worker-{os.getpid()}")
         logger.info("Worker started, waiting for jobs...")
         worker.work()
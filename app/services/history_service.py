@@ -34,17 +34,19 @@ class HistoryService:
         """
         return JSONUtils.load_json_file(self.history_file, [])
     
-    def save_history(self, history_data: List[Dict[str, Any]]) -> bool:
+    def save_history(self, history_data: List[Dict[str, Any]], durable: bool = False) -> bool:
         """
         Save history data to JSON file.
         
         Args:
             history_data: History data to save
+            durable: fsync before replacing the file. Routine saves skip it;
+                cleanup and clear operations request it.
             
         Returns:
             True if successful, False otherwise
         """
-        return JSONUtils.save_json_file(self.history_file, history_data)
+        return JSONUtils.save_json_file(self.history_file, history_data, durable=durable)
     
     def add_to_history(self, entry: Dict[str, Any]) -> bool:
         """
@@ -170,7 +172,7 @@ class HistoryService:
                 filtered_history.append(entry)
         
         # Save filtered history
-        if self.save_history(filtered_history):
+        if self.save_history(filtered_history, durable=True):
             current_app.logger.info(
                 f"History cleanup removed {removed_count} entries older than {days_threshold} days. "
                 f"{len(filtered_history)} entries remain."
@@ -188,7 +190,7 @@ class HistoryService:
             True if successful, False otherwise
         """
         empty_history = []
-        return self.save_history(empty_history)
+        return self.save_history(empty_history, durable=True)
 
     def delete_history_entries(self, entry_ids: List[str]) -> Tuple[int, int]:
         """Delete specific history entries by entry IDs.
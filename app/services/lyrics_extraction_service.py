@@ -8,20 +8,180 @@ import re
 import shutil
 import subprocess
 import tempfile
-import importlib
 import hashlib
 import time
-from collections import Counter
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future
 from typing import Optional, Tuple, List, Dict, Any
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
+from functools import lru_cache, partial
+from operator import is_not
+from threading import Lock, Thread
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import current_app
 
 from app import db
 from app.models import LyricsCache
 
+try:
+    from mutagen import File as mutagen_file_loader
+except ImportError:
+    mutagen_file_loader = None
+
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+except ImportError:
+    rapidfuzz_fuzz = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import assemblyai as aai
+except ImportError:
+    aai = None
+
+
+def _parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson's C parser when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """
+    Return the process-wide pooled HTTP session used for audio downloads
+    and LRCLIB lookups, creating it on first use.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                # Retry transient connection failures on our idempotent GETs
+                retries = Retry(total=3, backoff_factor=0.3, allowed_methods=frozenset({'GET'}))
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({'Connection': 'keep-alive'})
+                _http_session = session
+    return _http_session
+
+
+# Precompiled patterns for transcription post-processing and LRCLIB matching
+_WHITESPACE_RE = re.compile(r'\s+')
+_HORIZONTAL_WHITESPACE_RE = re.compile(r'[^\S\n]+')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_CHUNK_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+_TOKEN_RE = re.compile(r"[\w']+", re.UNICODE)
+_BRACKETED_SEGMENT_RE = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_NON_WORD_RE = re.compile(r'[^\w\s]', re.UNICODE)
+_TITLE_VERSION_SUFFIX_RE = re.compile(r'\([^)]*(?:remix|radio edit|album version|live)[^)]*\)', re.IGNORECASE)
+_TITLE_FEATURING_RE = re.compile(r'\[[^\]]*feat[^\]]*\]', re.IGNORECASE)
+_TITLE_TRAILING_DASH_RE = re.compile(r'\s*[-–—]\s*$')
+_LRC_TIMESTAMP_RE = re.compile(r'\[\d+:\d+\.\d+\]')
+# Lowercase Vietnamese letters; a set disjointness test finds them without a regex scan
+_VIETNAMESE_CHARS = frozenset(
+    'ăâđêôơưáàảãạấầẩẫậắằẳẵặéèẻẽẹếềểễệíìỉĩịóòỏõọốồổỗộớờởỡợúùủũụứừửữựýỳỷỹỵ'
+)
+# Applied one after another, as each pass can expose or consume text for the
+# next; a single alternation would pick different (leftmost) matches
+_HALLUCINATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # YouTube/social media prompts (Vietnamese)
+    r'[Hh]ãy\s+subscribe\s+.*?(?:kênh|channel).*?(?:\.|$)',
+    r'[Đđ]ừng\s+quên\s+(?:đăng\s+ký|subscribe).*?(?:\.|$)',
+    r'[Nn]hấn\s+(?:like|subscribe|đăng\s+ký).*?(?:\.|$)',
+    r'[Tt]heo\s+dõi\s+kênh.*?(?:\.|$)',
+    r'[Cc]ảm\s+ơn\s+(?:các\s+)?bạn\s+đã\s+(?:xem|theo\s+dõi).*?(?:\.|$)',
+    r'[Đđ]ể\s+không\s+bỏ\s+lỡ.*?(?:video|clip).*?(?:\.|$)',
+    r'[Gg]hiền\s+[Mm]ì\s+[Gg]õ.*?(?:\.|$)',
+    # English versions
+    r'[Pp]lease\s+subscribe.*?(?:\.|$)',
+    r'[Dd]on\'t\s+forget\s+to\s+(?:like|subscribe).*?(?:\.|$)',
+    r'[Hh]it\s+the\s+(?:bell|like|subscribe).*?(?:\.|$)',
+    r'[Tt]hanks\s+for\s+watching.*?(?:\.|$)',
+    # Generic channel/intro/outro markers
+    r'\[.*?(?:[Mm]usic|[Ii]ntro|[Oo]utro).*?\]',
+    r'♪.*?♪',
+))
+# C-level "is not None" predicate for filter(); keeps empty strings, unlike filter(None, ...)
+_is_not_none = partial(is_not, None)
+_MISSING = object()
+
+# Content-type subtypes, content-type substrings (checked in order, as a
+# fallback) and URL suffixes mapped to the extension used for downloaded audio.
+_CONTENT_SUBTYPE_EXTENSIONS = {
+    'mpeg': '.mp3',
+    'mp3': '.mp3',
+    'wav': '.wav',
+    'x-wav': '.wav',
+    'wave': '.wav',
+    'flac': '.flac',
+    'x-flac': '.flac',
+    'ogg': '.ogg',
+    'mp4': '.m4a',
+    'x-m4a': '.m4a',
+}
+_CONTENT_TYPE_EXTENSIONS = (
+    ('mpeg', '.mp3'),
+    ('wav', '.wav'),
+    ('flac', '.flac'),
+    ('ogg', '.ogg'),
+    ('mp4', '.m4a'),
+)
+_URL_SUFFIX_EXTENSIONS = {
+    'mp3': '.mp3',
+    'wav': '.wav',
+    'flac': '.flac',
+    'ogg': '.ogg',
+    'm4a': '.m4a',
+}
+_URL_EXTENSION_RE = re.compile(r'\.(mp3|wav|flac|ogg|m4a)(?:$|[?#])', re.IGNORECASE)
+
+# Streaming download sizes: large reads amortize per-chunk interpreter work,
+# and the write buffer coalesces them into fewer write(2) calls.
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+_DOWNLOAD_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Subprocess stderr is drained in chunks of this size, keeping only the last
+# few (16 KB) for error messages
+_STDERR_TAIL_CHUNK_SIZE = 4096
+_STDERR_TAIL_CHUNKS = 4
+
+_VIETNAMESE_COMMON_FIXES = tuple((re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in (
+    (r'\blời\s+bay\s+hát\b', 'lời bài hát'),
+    (r'\blời\s+bai\s+hát\b', 'lời bài hát'),
+    (r'\bhệ\s+thống\s+nhận\s+dạng\s+dọng\s+nói\b', 'hệ thống nhận dạng giọng nói'),
+    (r'\bdọng\s+nói\b', 'giọng nói'),
+    (r'\bdong\s+noi\b', 'giọng nói'),
+))
+
+
+class _CappedWriter:
+    """File wrapper that raises ValueError once more than max_bytes are written."""
+
+    def __init__(self, file_obj, max_bytes: int, error_message: str):
+        self._file = file_obj
+        self._remaining = max_bytes
+        self._error_message = error_message
+
+    def write(self, data) -> int:
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError(self._error_message)
+        return self._file.write(data)
+
 
 class LRCLIBClient:
     """Enhanced LRCLIB API client with advanced features."""
@@ -30,37 +190,66 @@ class LRCLIBClient:
     SEARCH_ENDPOINT = '/search'
     GET_ENDPOINT = '/get'
     
+    # Candidates whose track title is less similar than this score zero. Checked
+    # against both scorers: release variants such as "Let It Be - Remastered 2009"
+    # score about 0.53, so a higher cutoff would drop real matches
+    MIN_TRACK_SIMILARITY = 0.5
+    
+    # Match score weights; a criterion the caller did not supply earns half its
+    # weight, and perfect_score in _score_results is built from the same values
+    TRACK_WEIGHT = 50
+    ARTIST_WEIGHT = 25
+    ALBUM_WEIGHT = 10
+    DURATION_WEIGHT = 10
+    SYNCED_LYRICS_BONUS = 5
+    
     # Rate limiting
     MAX_REQUESTS_PER_MINUTE = 50
-    _request_times = []
+    # Longest Retry-After honoured on a 429 before retrying
+    MAX_RETRY_AFTER_SECONDS = 10
+    _request_times = deque(maxlen=MAX_REQUESTS_PER_MINUTE)
+    _rate_limit_lock = Lock()
+    
+    # Sent per request: the pooled session is shared with audio downloads
+    HEADERS = {'User-Agent': 'MusicCraft-LyricsExtractor/1.0'}
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'MusicCraft-LyricsExtractor/1.0'
-        })
+        # Process-wide keep-alive session, so successive searches (and the
+        # fallback strategies of a single lookup) reuse the LRCLIB connection
+        self.session = _get_http_session()
     
     @classmethod
     def _check_rate_limit(cls):
-        """Implement rate limiting to respect API usage."""
-        now = time.time()
-        # Remove requests older than 1 minute
-        cls._request_times = [t for t in cls._request_times if now - t < 60]
-        
-        if len(cls._request_times) >= cls.MAX_REQUESTS_PER_MINUTE:
-            sleep_time = 60 - (now - cls._request_times[0])
-            if sleep_time > 0:
-                current_app.logger.warning(f'Rate limit reached, sleeping {sleep_time:.2f}s')
-                time.sleep(sleep_time)
-        
-        cls._request_times.append(now)
+        """
+        Implement rate limiting to respect API usage.
+        
+        The limit is per process; Redis is not available to the web app, so
+        there is no cross-worker bucket.
+        """
+        with cls._rate_limit_lock:
+            request_times = cls._request_times
+            now = time.time()
+            # Drop requests older than 1 minute (oldest first)
+            while request_times and now - request_times[0] >= 60:
+                request_times.popleft()
+            
+            if len(request_times) >= cls.MAX_REQUESTS_PER_MINUTE:
+                sleep_time = 60 - (now - request_times[0])
+                if sleep_time > 0:
+                    current_app.logger.warning(f'Rate limit reached, sleeping {sleep_time:.2f}s')
+                    time.sleep(sleep_time)
+                now = time.time()
+            
+            # maxlen evicts the oldest entry once the window is full
+            request_times.append(now)
     
     def search_lyrics(
         self,
         track_name: str,
         artist_name: Optional[str] = None,
         album_name: Optional[str] = None,
-        duration: Optional[int] = None
+        duration: Optional[int] = None,
+        ranked: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Search LRCLIB for lyrics with enhanced matching.
@@ -70,6 +259,9 @@ class LRCLIBClient:
             artist_name: Artist name (optional, improves accuracy)
             album_name: Album name (optional, for disambiguation)
             duration: Track duration in seconds (optional, for disambiguation)
+            ranked: Sort results by match_score (highest first). Unranked
+                searches stop scoring at the first perfect match, so they
+                may return only a prefix of the candidates.
             
         Returns:
             List of matching results with metadata
@@ -94,7 +286,7 @@ class LRCLIBClient:
             if not response:
                 return []
             
-            results = response.json()
+            results = _parse_json_response(response)
             
             if not isinstance(results, list):
                 current_app.logger.warning(f'Unexpected LRCLIB response type: {type(results)}')
@@ -106,11 +298,13 @@ class LRCLIBClient:
                 track_name=track_name,
                 artist_name=artist_name,
                 album_name=album_name,
-                duration=duration
+                duration=duration,
+                stop_at_perfect=not ranked
             )
             
             # Sort by score (highest first)
-            scored_results.sort(key=lambda x: x['match_score'], reverse=True)
+            if ranked:
+                scored_results.sort(key=lambda x: x['match_score'], reverse=True)
             
             current_app.logger.info(
                 f'LRCLIB found {len(scored_results)} results for "{track_name}"'
@@ -122,6 +316,32 @@ class LRCLIBClient:
             current_app.logger.warning(f'LRCLIB search error: {exc}')
             return []
     
+    def search_best_match(
+        self,
+        track_name: str,
+        artist_name: Optional[str] = None,
+        album_name: Optional[str] = None,
+        duration: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Search LRCLIB and return only the highest scoring result.
+        
+        Picks the best candidate in one linear pass instead of sorting them all.
+        
+        Returns:
+            Best matching result with metadata, or None if nothing was found
+        """
+        results = self.search_lyrics(
+            track_name,
+            artist_name=artist_name,
+            album_name=album_name,
+            duration=duration,
+            ranked=False
+        )
+        if not results:
+            return None
+        return max(results, key=lambda x: x['match_score'])
+    
     def get_lyrics_by_id(self, lrclib_id: int) -> Optional[Dict[str, Any]]:
         """
         Get lyrics by LRCLIB ID for exact retrieval.
@@ -139,7 +359,7 @@ class LRCLIBClient:
             response = self._request_with_retry(url)
             
             if response:
-                return response.json()
+                return _parse_json_response(response)
             
             return None
             
@@ -155,48 +375,55 @@ class LRCLIBClient:
         timeout: int = 15
     ) -> Optional[requests.Response]:
         """
-        Make request with exponential backoff retry logic.
+        Make request with exponential backoff retry logic for server errors and 429s.
+        
+        Timeouts and network errors are retried by the session's adapter.
         """
         last_error = None
+        attempts = 0
         
         for attempt in range(max_retries):
+            attempts = attempt + 1
             try:
                 response = self.session.get(
                     url,
                     params=params,
+                    headers=self.HEADERS,
                     timeout=timeout
                 )
-                response.raise_for_status()
-                return response
+                status_code = response.status_code
+                if status_code < 400:
+                    return response
                 
-            except requests.exceptions.Timeout as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 0.5  # Exponential backoff
+                # Branch on status instead of raise_for_status(): 404 is the
+                # normal "no match" answer and should not cost an exception
+                if status_code == 404:
+                    return None
+                
+                last_error = f'HTTP {status_code}'
+                # 429 is retried like a server error, waiting as long as
+                # LRCLIB's Retry-After asks (capped) when it sends one
+                if (status_code == 429 or status_code >= 500) and attempt < max_retries - 1:
+                    wait_time = (2 ** attempt) * 0.5
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        wait_time = min(int(retry_after), self.MAX_RETRY_AFTER_SECONDS)
                     current_app.logger.warning(
-                        f'LRCLIB timeout (attempt {attempt + 1}/{max_retries}), '
-                        f'retrying in {wait_time}s'
+                        f'LRCLIB returned {status_code} (attempt {attempts}/{max_retries}, '
+                        f'Retry-After: {retry_after or "none"}), retrying in {wait_time}s'
                     )
                     time.sleep(wait_time)
                     continue
-                    
+                break
+                
             except requests.exceptions.RequestException as e:
+                # The shared session's adapter has already retried timeouts and
+                # network errors with backoff; retrying here would multiply them
                 last_error = e
-                if attempt < max_retries - 1 and e.response is None:
-                    # Network error, retry
-                    wait_time = (2 ** attempt) * 0.5
-                    current_app.logger.warning(
-                        f'LRCLIB network error (attempt {attempt + 1}/{max_retries}), '
-                        f'retrying in {wait_time}s'
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # HTTP error or final attempt
-                    break
+                break
         
         if last_error:
-            current_app.logger.error(f'LRCLIB request failed after {max_retries} attempts: {last_error}')
+            current_app.logger.error(f'LRCLIB request failed after {attempts} attempt(s): {last_error}')
         
         return None
     
@@ -206,61 +433,89 @@ class LRCLIBClient:
         track_name: str,
         artist_name: Optional[str] = None,
         album_name: Optional[str] = None,
-        duration: Optional[int] = None
+        duration: Optional[int] = None,
+        stop_at_perfect: bool = False
     ) -> List[Dict]:
         """
         Score search results based on similarity and metadata match.
+        
+        With stop_at_perfect, scoring ends at the first result reaching the
+        highest achievable score; no later result can rank above it.
         """
         scored = []
+        perfect_score = (
+            self.TRACK_WEIGHT
+            + (self.ARTIST_WEIGHT if artist_name else self.ARTIST_WEIGHT / 2)
+            + (self.ALBUM_WEIGHT if album_name else self.ALBUM_WEIGHT / 2)
+            + (self.DURATION_WEIGHT if duration else self.DURATION_WEIGHT / 2)
+            + self.SYNCED_LYRICS_BONUS
+        )
+        normalize = self._normalize_for_comparison
+        similarity_score = self._normalized_similarity_score
+        
+        # Normalize the query side once rather than once per candidate
+        query_track = normalize(track_name) if track_name else None
+        query_artist = normalize(artist_name) if artist_name else None
+        query_album = normalize(album_name) if album_name else None
         
         for result in results:
             score = 0.0
             
-            # Track name similarity (most important - max 50 points)
+            # Track name similarity (most important)
             result_track = result.get('trackName', '')
-            if result_track:
-                similarity = self._similarity_score(track_name, result_track)
-                score += similarity * 50
+            if result_track and query_track is not None:
+                similarity = similarity_score(
+                    query_track, normalize(result_track), score_cutoff=self.MIN_TRACK_SIMILARITY
+                )
+                if not similarity:
+                    # A different song; don't let artist/album points carry it
+                    result['match_score'] = 0.0
+                    scored.append(result)
+                    continue
+                score += similarity * self.TRACK_WEIGHT
             
-            # Artist name match (max 25 points)
+            # Artist name match
             if artist_name:
                 result_artist = result.get('artistName', '')
                 if result_artist:
-                    similarity = self._similarity_score(artist_name, result_artist)
-                    score += similarity * 25
+                    similarity = similarity_score(query_artist, normalize(result_artist))
+                    score += similarity * self.ARTIST_WEIGHT
             else:
                 # No artist provided, give partial credit
-                score += 12.5
+                score += self.ARTIST_WEIGHT / 2
             
-            # Album match (max 10 points)
+            # Album match
             if album_name:
                 result_album = result.get('albumName', '')
                 if result_album:
-                    similarity = self._similarity_score(album_name, result_album)
-                    score += similarity * 10
+                    similarity = similarity_score(query_album, normalize(result_album))
+                    score += similarity * self.ALBUM_WEIGHT
             else:
-                score += 5
+                score += self.ALBUM_WEIGHT / 2
             
-            # Duration match (max 10 points)
+            # Duration match
             if duration:
                 result_duration = result.get('duration')
                 if result_duration:
                     # Allow 5% variance
                     diff_ratio = abs(duration - result_duration) / max(duration, 1)
                     if diff_ratio <= 0.05:
-                        score += 10
+                        score += self.DURATION_WEIGHT
                     elif diff_ratio <= 0.10:
-                        score += 5
+                        score += self.DURATION_WEIGHT / 2
             else:
-                score += 5
+                score += self.DURATION_WEIGHT / 2
             
-            # Bonus for synced lyrics (5 points)
+            # Bonus for synced lyrics
             if result.get('syncedLyrics'):
-                score += 5
+                score += self.SYNCED_LYRICS_BONUS
             
             # Store score in result
             result['match_score'] = score
             scored.append(result)
+            
+            if stop_at_perfect and score >= perfect_score:
+                break
         
         return scored
     
@@ -273,15 +528,38 @@ class LRCLIBClient:
         if not str1 or not str2:
             return 0.0
         
-        # Normalize strings
-        s1 = LRCLIBClient._normalize_for_comparison(str1)
-        s2 = LRCLIBClient._normalize_for_comparison(str2)
+        # Identical inputs always normalize to the same string; skip the regex work
+        if str1 == str2:
+            return 1.0
+        
+        return LRCLIBClient._normalized_similarity_score(
+            LRCLIBClient._normalize_for_comparison(str1),
+            LRCLIBClient._normalize_for_comparison(str2)
+        )
+    
+    @staticmethod
+    def _normalized_similarity_score(s1: str, s2: str, score_cutoff: float = 0.0) -> float:
+        """
+        Similarity score (0-1) for strings already passed through _normalize_for_comparison.
         
+        Scores below score_cutoff are reported as 0.0, which lets hopeless
+        pairs bail out before the full comparison.
+        """
         if s1 == s2:
             return 1.0
         
-        # Use SequenceMatcher for fuzzy matching
-        return SequenceMatcher(None, s1, s2).ratio()
+        # rapidfuzz's ratio is Indel (LCS-based) similarity, not SequenceMatcher's
+        # Ratcliff-Obershelp matching: it is never lower and can be higher for
+        # short unrelated strings, so the two paths agree closely but not exactly
+        if rapidfuzz_fuzz is not None:
+            return rapidfuzz_fuzz.ratio(s1, s2, score_cutoff=score_cutoff * 100) / 100.0
+        
+        # Length-only upper bound on the ratio
+        total_length = len(s1) + len(s2)
+        if score_cutoff and 2 * min(len(s1), len(s2)) < score_cutoff * total_length:
+            return 0.0
+        ratio = SequenceMatcher(None, s1, s2).ratio()
+        return ratio if ratio >= score_cutoff else 0.0
     
     @staticmethod
     def _normalize_for_search(text: str) -> str:
@@ -295,6 +573,7 @@ class LRCLIBClient:
         return normalized.strip()
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _normalize_for_comparison(text: str) -> str:
         """Normalize text for similarity comparison."""
         if not text:
@@ -303,39 +582,61 @@ class LRCLIBClient:
         # Convert to lowercase
         text = text.lower()
         
-        # Remove common noise words
-        text = re.sub(r'\(.*?\)', '', text)  # Remove parentheticals
-        text = re.sub(r'\[.*?\]', '', text)  # Remove brackets
+        # Remove common noise words: parentheticals and brackets in one pass
+        text = _BRACKETED_SEGMENT_RE.sub('', text)
         
         # Remove special characters but keep spaces
-        text = re.sub(r'[^\w\s]', '', text, flags=re.UNICODE)
+        text = _NON_WORD_RE.sub('', text)
         
         # Normalize whitespace
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 class LyricsCacheManager:
     """Manage persistent caching of LRCLIB results."""
     
+    # Recent DB hits kept in process, so re-processing several files of the
+    # same track skips the round-trip; cache_lyrics drops the entry it rewrites
+    _recent_hits: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _recent_hits_lock = Lock()
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_cache_key(artist: str, title: str) -> str:
         """Generate cache key for artist/title pair."""
+        # Key format must stay stable: existing LyricsCache rows are stored under it
         normalized = f"{artist}:{title}".lower().strip()
         return hashlib.md5(normalized.encode('utf-8')).hexdigest()
     
     @staticmethod
     def get_cached_lyrics(artist: str, title: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached lyrics if available and not expired."""
-        if not current_app.config.get('LYRICS_CACHE_ENABLED', True):
+        app_config = current_app.config
+        if not app_config.get('LYRICS_CACHE_ENABLED', True):
             return None
         
         cache_key = LyricsCacheManager.get_cache_key(artist, title)
-        cache_ttl_days = int(current_app.config.get('LYRICS_CACHE_TTL_DAYS', 30))
+        cache_ttl_days = int(app_config.get('LYRICS_CACHE_TTL_DAYS', 30))
+        memory_ttl = int(app_config.get('LYRICS_CACHE_MEMORY_TTL_SECONDS', 600))
+        
+        if memory_ttl > 0:
+            recent = LyricsCacheManager._get_recent_hit(cache_key)
+            if recent is not None:
+                current_app.logger.info(f'Cache hit for {artist} - {title} (in-process)')
+                return recent
         
         try:
-            cached = LyricsCache.query.filter_by(cache_key=cache_key).first()
+            # Read scalar columns only; no ORM instance is needed for a lookup
+            cached = db.session.query(
+                LyricsCache.lyrics_text,
+                LyricsCache.synced_lyrics,
+                LyricsCache.lrclib_id,
+                LyricsCache.artist_name,
+                LyricsCache.track_name,
+                LyricsCache.album_name,
+                LyricsCache.match_score,
+                LyricsCache.created_at,
+            ).filter(LyricsCache.cache_key == cache_key).first()
             
             if not cached:
                 return None
@@ -343,14 +644,14 @@ class LyricsCacheManager:
             # Check if expired
             expiry = cached.created_at + timedelta(days=cache_ttl_days)
             if datetime.utcnow() > expiry:
+                # Leave the row: cache_lyrics refreshes it in place on the next
+                # successful lookup, so a delete + commit here is wasted work
                 current_app.logger.debug(f'Cache expired for {artist} - {title}')
-                db.session.delete(cached)
-                db.session.commit()
                 return None
             
             current_app.logger.info(f'Cache hit for {artist} - {title}')
             
-            return {
+            result = {
                 'lyrics': cached.lyrics_text,
                 'synced_lyrics': cached.synced_lyrics,
                 'source': 'lrclib_cache',
@@ -361,10 +662,45 @@ class LyricsCacheManager:
                 'match_score': cached.match_score
             }
             
+            if memory_ttl > 0:
+                # Never keep an entry in memory past the row's own expiry
+                remaining = (expiry - datetime.utcnow()).total_seconds()
+                LyricsCacheManager._remember_hit(
+                    cache_key,
+                    result,
+                    min(memory_ttl, remaining),
+                    int(app_config.get('LYRICS_CACHE_MEMORY_SIZE', 1024))
+                )
+            
+            return result
+            
         except Exception as exc:
             current_app.logger.warning(f'Cache retrieval error: {exc}')
             return None
     
+    @staticmethod
+    def _get_recent_hit(cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a remembered DB hit, or None if absent or expired."""
+        with LyricsCacheManager._recent_hits_lock:
+            entry = LyricsCacheManager._recent_hits.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.time() > expires_at:
+                del LyricsCacheManager._recent_hits[cache_key]
+                return None
+            LyricsCacheManager._recent_hits.move_to_end(cache_key)
+            return dict(result)
+    
+    @staticmethod
+    def _remember_hit(cache_key: str, result: Dict[str, Any], ttl_seconds: float, max_entries: int):
+        """Keep a DB hit in process for ttl_seconds, evicting least recently used entries."""
+        with LyricsCacheManager._recent_hits_lock:
+            LyricsCacheManager._recent_hits[cache_key] = (time.time() + ttl_seconds, dict(result))
+            LyricsCacheManager._recent_hits.move_to_end(cache_key)
+            while len(LyricsCacheManager._recent_hits) > max_entries:
+                LyricsCacheManager._recent_hits.popitem(last=False)
+    
     @staticmethod
     def cache_lyrics(
         artist: str,
@@ -382,6 +718,10 @@ class LyricsCacheManager:
         
         cache_key = LyricsCacheManager.get_cache_key(artist, title)
         
+        # The row is about to change; stop serving the remembered copy
+        with LyricsCacheManager._recent_hits_lock:
+            LyricsCacheManager._recent_hits.pop(cache_key, None)
+        
         try:
             # Check if already exists
             cached = LyricsCache.query.filter_by(cache_key=cache_key).first()
@@ -418,6 +758,95 @@ class LyricsCacheManager:
             db.session.rollback()
 
 
+class LyricsResultCache:
+    """
+    In-process LRU cache of extraction results keyed by audio content.
+
+    Re-extracting the same audio (job retries, the same upload from another
+    user) returns the stored result without re-parsing tags or re-running
+    transcription. Only successful extractions are stored: a miss may come
+    from a transient LRCLIB or AssemblyAI failure, and retries must re-run.
+    """
+
+    HASH_PREFIX_BYTES = 4 * 1024 * 1024
+
+    # Settings that change what extraction returns for the same audio. They are
+    # part of the key, so a config change is never answered with old lyrics.
+    KEY_CONFIG_SETTINGS = (
+        'LYRICS_USE_LRCLIB',
+        'LYRICS_USE_ENHANCED_LRCLIB',
+        'LRCLIB_MIN_MATCH_SCORE',
+        'LRCLIB_USE_SYNCED_LYRICS',
+        'LYRICS_USE_ASSEMBLYAI',
+        'LYRICS_VOCAL_SEPARATION_ENABLED',
+        'LYRICS_WHISPER_LANGUAGE',
+        'LYRICS_ENFORCE_ORIGINAL_LANGUAGE',
+        'LYRICS_MAX_REPEATED_NGRAM_RATIO',
+        'LYRICS_MAX_SAME_CHUNK_REPEATS',
+        'LYRICS_MIN_UNIQUE_WORD_RATIO',
+        'LYRICS_VI_CUSTOM_CORRECTIONS_JSON',
+    )
+
+    _entries: "OrderedDict[str, Tuple[float, Tuple[Optional[str], Optional[str], Optional[str]]]]" = OrderedDict()
+    _lock = Lock()
+
+    @classmethod
+    def make_key(cls, audio_path: str, language: Optional[str]) -> Optional[str]:
+        """
+        Hash the first few MB of the file, its size, the language hint and the
+        output-shaping settings. Returns None without reading the file when
+        the cache is disabled.
+        """
+        app_config = current_app.config
+        if not app_config.get('LYRICS_RESULT_CACHE_ENABLED', True):
+            return None
+
+        try:
+            digest = hashlib.sha256()
+            digest.update(str(os.path.getsize(audio_path)).encode('ascii'))
+            with open(audio_path, 'rb') as audio_file:
+                digest.update(audio_file.read(cls.HASH_PREFIX_BYTES))
+            digest.update(f":{(language or '').strip().lower()}".encode('utf-8'))
+            settings = [app_config.get(name) for name in cls.KEY_CONFIG_SETTINGS]
+            digest.update(f":{settings!r}".encode('utf-8'))
+            return digest.hexdigest()
+        except OSError:
+            return None
+
+    @classmethod
+    def get(cls, key: Optional[str]):
+        """Return the cached (lyrics, source, error) tuple, or None."""
+        if not key or not current_app.config.get('LYRICS_RESULT_CACHE_ENABLED', True):
+            return None
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.time() > expires_at:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return result
+
+    @classmethod
+    def set(cls, key: Optional[str], result: Tuple[Optional[str], Optional[str], Optional[str]]):
+        """Store a successful result; misses are never cached."""
+        app_config = current_app.config
+        if not key or not result[0] or not app_config.get('LYRICS_RESULT_CACHE_ENABLED', True):
+            return
+
+        ttl = int(app_config.get('LYRICS_RESULT_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+        max_entries = int(app_config.get('LYRICS_RESULT_CACHE_SIZE', 256))
+
+        with cls._lock:
+            cls._entries[key] = (time.time() + ttl, result)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > max_entries:
+                cls._entries.popitem(last=False)
+
+
 class LyricsExtractionService:
     """
     Service for extracting lyrics from audio.
@@ -469,26 +898,31 @@ class LyricsExtractionServiceLegacy:
     Tier 3: AssemblyAI speech-to-text (fast cloud transcription)
     """
     
-    METADATA_KEYS = {
+    METADATA_KEYS = frozenset({
         'lyrics',
         'unsyncedlyrics',
         '\u00a9lyr',
         'lyric',
-    }
+    })
 
     MIN_WORDS_FOR_ACCEPT = 6
-    _VIETNAMESE_COMMON_FIXES = (
-        (r'\blời\s+bay\s+hát\b', 'lời bài hát'),
-        (r'\blời\s+bai\s+hát\b', 'lời bài hát'),
-        (r'\bhệ\s+thống\s+nhận\s+dạng\s+dọng\s+nói\b', 'hệ thống nhận dạng giọng nói'),
-        (r'\bdọng\s+nói\b', 'giọng nói'),
-        (r'\bdong\s+noi\b', 'giọng nói'),
-    )
-    _ENGLISH_STOPWORDS = {
+    _ENGLISH_STOPWORDS = frozenset({
         'the', 'and', 'you', 'your', 'this', 'that', 'with', 'for', 'are', 'was', 'were',
         'have', 'has', 'from', 'into', 'song', 'lyrics', 'love', 'baby', 'night', 'heart',
         'when', 'what', 'where', 'why', 'how', 'hello', 'world', 'test'
-    }
+    })
+    # (config JSON, compiled fixes) for LYRICS_VI_CUSTOM_CORRECTIONS_JSON
+    _custom_corrections_cache = (None, None)
+    _assemblyai_transcriber_cache = (None, None)
+
+    def __init__(self):
+        # (path, mutagen file) parsed during the current extract_lyrics call
+        self._parsed_audio = (None, None)
+
+    @property
+    def _session(self) -> requests.Session:
+        """Shared keep-alive session for outbound HTTP requests."""
+        return _get_http_session()
 
     def extract_lyrics(
         self,
@@ -506,12 +940,16 @@ class LyricsExtractionServiceLegacy:
         Returns:
             Tuple of (lyrics, source, error)
         """
-        if not current_app.config.get('LYRICS_EXTRACTION_ENABLED', True):
+        app_config = current_app.config
+        if not app_config.get('LYRICS_EXTRACTION_ENABLED', True):
             return None, None, 'Lyrics extraction is disabled'
 
         if not audio_url and not local_file_path:
             return None, None, 'No audio source provided'
 
+        # A parse memoized by an earlier call may describe a file that has
+        # since changed or been deleted with its temp dir
+        self._parsed_audio = (None, None)
         temp_dir = tempfile.mkdtemp(prefix='lyrics_extract_')
         try:
             # Resolve audio file path
@@ -519,51 +957,71 @@ class LyricsExtractionServiceLegacy:
             if not target_path:
                 target_path = self._download_audio_file(audio_url, temp_dir)
 
-            # --- Tier 1: Embedded metadata ---
-            metadata_lyrics = self._extract_metadata_lyrics(target_path)
-            if metadata_lyrics:
-                current_app.logger.info('Lyrics resolved via Tier 1: embedded metadata')
-                return metadata_lyrics, 'metadata', None
-
-            # --- Tier 2: LRCLIB API lookup ---
-            artist, title = self._extract_artist_title(target_path)
-            lrclib_lyrics = self._lookup_lyrics_lrclib(artist, title)
-            if lrclib_lyrics:
-                current_app.logger.info('Lyrics resolved via Tier 2: LRCLIB')
-                return lrclib_lyrics, 'lrclib', None
-
-            # --- Tier 3: AssemblyAI transcription ---
-            # Optionally separate vocals first for better accuracy
-            transcription_target = target_path
-            if current_app.config.get('LYRICS_VOCAL_SEPARATION_ENABLED', False):
-                separated_path = self._separate_vocals_with_demucs(target_path, temp_dir)
-                if separated_path:
-                    transcription_target = separated_path
-
-            raw_lyrics = self._transcribe_with_assemblyai(
-                transcription_target,
-                language_override=whisper_language_override,
-            )
-
-            if raw_lyrics:
-                # Apply post-processing (de-duplication, cleanup)
-                cleaned = self._postprocess_lyrics(raw_lyrics)
-                # Apply Vietnamese corrections if applicable
-                language = whisper_language_override or current_app.config.get('LYRICS_WHISPER_LANGUAGE')
-                final = self._apply_language_post_corrections(cleaned, language)
+            language = whisper_language_override or app_config.get('LYRICS_WHISPER_LANGUAGE')
+            cache_key = LyricsResultCache.make_key(target_path, language)
+            cached_result = LyricsResultCache.get(cache_key)
+            if cached_result is not None:
+                current_app.logger.info('Lyrics result served from content-hash cache')
+                return cached_result
 
-                if final and self._is_transcription_usable(final, expected_language=language):
-                    current_app.logger.info('Lyrics resolved via Tier 3: AssemblyAI')
-                    return final, 'assemblyai', None
-
-            return None, None, 'No lyrics detected from metadata, database lookup, or transcription'
+            result = self._run_tiers(target_path, temp_dir, whisper_language_override)
+            LyricsResultCache.set(cache_key, result)
+            return result
 
         except Exception as exc:
             current_app.logger.warning(f'Lyrics extraction failed: {exc}')
             return None, None, str(exc)
         finally:
+            self._parsed_audio = (None, None)
             shutil.rmtree(temp_dir, ignore_errors=True)
 
+    def _run_tiers(
+        self,
+        target_path: str,
+        temp_dir: str,
+        whisper_language_override: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Run the tier chain against a resolved local audio file."""
+        # --- Tier 1: Embedded metadata ---
+        metadata_lyrics = self._extract_metadata_lyrics(target_path)
+        if metadata_lyrics:
+            current_app.logger.info('Lyrics resolved via Tier 1: embedded metadata')
+            return metadata_lyrics, 'metadata', None
+
+        # --- Tier 2: LRCLIB API lookup ---
+        artist, title = self._extract_artist_title(target_path)
+        lrclib_lyrics = self._lookup_lyrics_lrclib(artist, title)
+        if lrclib_lyrics:
+            current_app.logger.info('Lyrics resolved via Tier 2: LRCLIB')
+            return lrclib_lyrics, 'lrclib', None
+
+        # --- Tier 3: AssemblyAI transcription ---
+        # Optionally separate vocals first for better accuracy
+        transcription_target = target_path
+        app_config = current_app.config
+        if app_config.get('LYRICS_VOCAL_SEPARATION_ENABLED', False):
+            separated_path = self._separate_vocals_with_demucs(target_path, temp_dir)
+            if separated_path:
+                transcription_target = separated_path
+
+        raw_lyrics = self._transcribe_with_assemblyai(
+            transcription_target,
+            language_override=whisper_language_override,
+        )
+
+        if raw_lyrics:
+            # Apply post-processing (de-duplication, cleanup)
+            cleaned = self._postprocess_lyrics(raw_lyrics)
+            # Apply Vietnamese corrections if applicable
+            language = whisper_language_override or app_config.get('LYRICS_WHISPER_LANGUAGE')
+            final = self._apply_language_post_corrections(cleaned, language)
+
+            if final and self._is_transcription_usable(final, expected_language=language):
+                current_app.logger.info('Lyrics resolved via Tier 3: AssemblyAI')
+                return final, 'assemblyai', None
+
+        return None, None, 'No lyrics detected from metadata, database lookup, or transcription'
+
     def _lookup_lyrics_lrclib(
         self,
         artist: Optional[str],
@@ -591,13 +1049,13 @@ class LyricsExtractionServiceLegacy:
             
             current_app.logger.debug(f'LRCLIB search: "{artist}" - "{title}"')
             
-            response = requests.get(
+            response = self._session.get(
                 lrclib_url,
                 params=params,
                 timeout=10,
             )
             response.raise_for_status()
-            results = response.json()
+            results = _parse_json_response(response)
 
             if not isinstance(results, list) or len(results) == 0:
                 current_app.logger.debug(f'LRCLIB: No results found for "{artist}" - "{title}"')
@@ -639,16 +1097,15 @@ class LyricsExtractionServiceLegacy:
         Free tier: 185 hours of pre-recorded audio.
         Paid: ~$0.0037/min (cheaper than OpenAI Whisper).
         """
-        if not current_app.config.get('LYRICS_USE_ASSEMBLYAI', False):
+        app_config = current_app.config
+        if not app_config.get('LYRICS_USE_ASSEMBLYAI', False):
             return None
 
-        try:
-            import assemblyai as aai
-        except ImportError:
+        if aai is None:
             current_app.logger.error('assemblyai package not installed')
             return None
 
-        api_key = current_app.config.get('ASSEMBLYAI_API_KEY', '')
+        api_key = app_config.get('ASSEMBLYAI_API_KEY', '')
         if not api_key:
             current_app.logger.error('ASSEMBLYAI_API_KEY not configured')
             return None
@@ -657,7 +1114,7 @@ class LyricsExtractionServiceLegacy:
 
         try:
             # Configure with speech_models (v0.52.0+)
-            language = language_override or current_app.config.get('LYRICS_WHISPER_LANGUAGE')
+            language = language_override or app_config.get('LYRICS_WHISPER_LANGUAGE')
             
             if language:
                 config = aai.TranscriptionConfig(
@@ -671,7 +1128,7 @@ class LyricsExtractionServiceLegacy:
                 )
 
             # The SDK handles file upload and polling automatically
-            transcriber = aai.Transcriber()
+            transcriber = self._get_assemblyai_transcriber(api_key)
             transcript = transcriber.transcribe(audio_path, config=config)
 
             if transcript.status == aai.TranscriptStatus.error:
@@ -693,60 +1150,101 @@ class LyricsExtractionServiceLegacy:
             current_app.logger.error(f'AssemblyAI API error: {exc}')
             return None
 
+    @staticmethod
+    def _get_assemblyai_transcriber(api_key: str):
+        """
+        Return a Transcriber shared across calls, rebuilt only when the API key changes.
+
+        Each Transcriber binds the SDK client and owns its own thread pool, so
+        creating one per transcription is wasted setup.
+        """
+        cached_key, cached_transcriber = LyricsExtractionServiceLegacy._assemblyai_transcriber_cache
+        if cached_key == api_key and cached_transcriber is not None:
+            return cached_transcriber
+
+        transcriber = aai.Transcriber()
+        LyricsExtractionServiceLegacy._assemblyai_transcriber_cache = (api_key, transcriber)
+        return transcriber
+
+    def _load_audio_file(self, audio_path: str):
+        """
+        Parse audio_path with mutagen, reusing the parse for the same path
+        within one extract_lyrics call.
+
+        The tier chain reads lyrics, artist/title, duration and album from the
+        same downloaded file; parsing it once avoids re-reading the file for
+        each of them.
+        """
+        cached_path, cached_file = self._parsed_audio
+        if cached_path == audio_path:
+            return cached_file
+
+        audio_file = mutagen_file_loader(audio_path)
+        self._parsed_audio = (audio_path, audio_file)
+        return audio_file
+
+    @staticmethod
+    def _build_tag_map(tags) -> Dict[str, Any]:
+        """
+        Return mutagen tags as a plain dict keyed by lowercased tag name.
+
+        Vorbis comments are a list of (key, value) pairs with case-insensitive
+        keys; their values are grouped into lists as mutagen's own lookup does.
+        For other tag types the first key per lowercased name wins.
+        """
+        tag_map = {}
+        if isinstance(tags, list):
+            for key, value in tags:
+                tag_map.setdefault(key.lower(), []).append(value)
+        else:
+            for key, value in tags.items():
+                tag_map.setdefault(str(key).lower(), value)
+        return tag_map
+
     def _extract_artist_title(self, audio_path: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract artist and title from audio file metadata tags."""
-        try:
-            mutagen_module = importlib.import_module('mutagen')
-            mutagen_file_loader = getattr(mutagen_module, 'File')
-        except Exception:
+        if mutagen_file_loader is None:
             return None, None
 
         try:
-            audio_file = mutagen_file_loader(audio_path)
+            audio_file = self._load_audio_file(audio_path)
             if not audio_file or not getattr(audio_file, 'tags', None):
                 return None, None
 
-            tags = audio_file.tags
+            # One pass over the tags; probing Vorbis comments by key is a
+            # linear scan per lookup
+            tag_map = self._build_tag_map(audio_file.tags)
             artist = None
             title = None
 
             # ID3 tags (MP3)
-            for key in ['TPE1', 'TPE2']:
-                if key in tags:
-                    artist = self._normalize_tag_value(tags[key])
+            for key in ('tpe1', 'tpe2'):
+                if key in tag_map:
+                    artist = self._normalize_tag_value(tag_map[key])
                     if artist:
                         break
-            if 'TIT2' in tags:
-                title = self._normalize_tag_value(tags['TIT2'])
+            if 'tit2' in tag_map:
+                title = self._normalize_tag_value(tag_map['tit2'])
 
-            # Vorbis comments (FLAC, OGG)
+            # Vorbis comments (FLAC, OGG) and other case-insensitive tags,
+            # then MP4/M4A atoms
             if not artist:
-                for key in ['artist', 'ARTIST', 'albumartist', 'ALBUMARTIST']:
-                    if key in tags:
-                        val = tags[key]
+                for key in ('artist', 'albumartist', '\xa9art'):
+                    if key in tag_map:
+                        val = tag_map[key]
                         artist = val[0] if isinstance(val, list) else str(val)
                         artist = artist.strip() if artist else None
                         if artist:
                             break
             if not title:
-                for key in ['title', 'TITLE']:
-                    if key in tags:
-                        val = tags[key]
+                for key in ('title', '\xa9nam'):
+                    if key in tag_map:
+                        val = tag_map[key]
                         title = val[0] if isinstance(val, list) else str(val)
                         title = title.strip() if title else None
                         if title:
                             break
 
-            # MP4/M4A atoms
-            if not artist and '\xa9ART' in tags:
-                val = tags['\xa9ART']
-                artist = val[0] if isinstance(val, list) else str(val)
-                artist = artist.strip() if artist else None
-            if not title and '\xa9nam' in tags:
-                val = tags['\xa9nam']
-                title = val[0] if isinstance(val, list) else str(val)
-                title = title.strip() if title else None
-
             return artist, title
 
         except Exception as exc:
@@ -755,30 +1253,18 @@ class LyricsExtractionServiceLegacy:
 
     def _extract_metadata_lyrics(self, audio_path: str) -> Optional[str]:
         """Extract lyrics from metadata tags (ID3, MP4 tags, etc)."""
-        try:
-            mutagen_module = importlib.import_module('mutagen')
-            mutagen_file_loader = getattr(mutagen_module, 'File')
-        except Exception as exc:
-            current_app.logger.info(f'Mutagen unavailable for metadata extraction: {exc}')
+        if mutagen_file_loader is None:
+            current_app.logger.info('Mutagen unavailable for metadata extraction')
             return None
 
         try:
-            audio_file = mutagen_file_loader(audio_path)
+            audio_file = self._load_audio_file(audio_path)
             if not audio_file or not getattr(audio_file, 'tags', None):
                 return None
 
-            tags = audio_file.tags
-
-            for key in self.METADATA_KEYS:
-                if key in tags:
-                    value = tags.get(key)
-                    lyrics = self._normalize_tag_value(value)
-                    if lyrics:
-                        return lyrics
-
-            for key, value in tags.items():
-                lowered = str(key).lower()
-                if 'lyric' in lowered or key == 'USLT':
+            metadata_keys = self.METADATA_KEYS
+            for key, value in audio_file.tags.items():
+                if key in metadata_keys or key == 'USLT' or 'lyric' in str(key).lower():
                     lyrics = self._normalize_tag_value(value)
                     if lyrics:
                         return lyrics
@@ -807,11 +1293,34 @@ class LyricsExtractionServiceLegacy:
         ]
 
         try:
-            completed = subprocess.run(command, check=False, capture_output=True, text=True, timeout=300)
-            if completed.returncode != 0:
-                current_app.logger.info(
-                    f'Demucs failed ({completed.returncode}): {completed.stderr[:300] if completed.stderr else ""}'
-                )
+            # Demucs writes progress bars to stderr; keep only a short tail of it
+            # instead of buffering the whole output in memory. The bars are
+            # \r-terminated, so read fixed-size chunks rather than lines.
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            stderr_tail = deque(maxlen=_STDERR_TAIL_CHUNKS)
+
+            def drain_stderr():
+                try:
+                    for chunk in iter(lambda: process.stderr.read(_STDERR_TAIL_CHUNK_SIZE), b''):
+                        stderr_tail.append(chunk)
+                finally:
+                    process.stderr.close()
+
+            drain_thread = Thread(target=drain_stderr, daemon=True)
+            drain_thread.start()
+            try:
+                returncode = process.wait(timeout=300)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                drain_thread.join(timeout=5)
+                current_app.logger.info('Demucs timed out after 300s; process killed')
+                return None
+            drain_thread.join(timeout=5)
+
+            if returncode != 0:
+                stderr_text = b''.join(stderr_tail).decode(errors='replace')
+                current_app.logger.info(f'Demucs failed ({returncode}): {stderr_text[-300:]}')
                 return None
 
             audio_basename = os.path.splitext(os.path.basename(audio_path))[0]
@@ -830,11 +1339,13 @@ class LyricsExtractionServiceLegacy:
         if not text:
             return False
 
-        if self._looks_translated_output(text, expected_language):
+        # Tokenize once and share the word list with every check below
+        words = self._tokenize_words(text)
+
+        if self._looks_translated_output(text, expected_language, words=words):
             current_app.logger.info('Rejected transcription that appears translated instead of original language')
             return False
 
-        words = self._tokenize_words(text)
         if len(words) < self.MIN_WORDS_FOR_ACCEPT:
             return False
 
@@ -847,7 +1358,12 @@ class LyricsExtractionServiceLegacy:
 
         return True
 
-    def _looks_translated_output(self, text: Optional[str], expected_language: Optional[str]) -> bool:
+    def _looks_translated_output(
+        self,
+        text: Optional[str],
+        expected_language: Optional[str],
+        words: Optional[List[str]] = None
+    ) -> bool:
         """Detect likely translated output when we expect Vietnamese original text."""
         if not text or not expected_language:
             return False
@@ -860,16 +1376,23 @@ class LyricsExtractionServiceLegacy:
         if not language.startswith('vi'):
             return False
 
-        words = self._tokenize_words(text)
-        if not words:
+        # Vietnamese diacritics rule out a translation, so skip the word scan
+        if not text.isascii() and not _VIETNAMESE_CHARS.isdisjoint(text.lower()):
             return False
 
-        has_vietnamese_chars = bool(re.search(r'[ăâđêôơưáàảãạấầẩẫậắằẳẵặéèẻẽẹếềểễệíìỉĩịóòỏõọốồổỗộớờởỡợúùủũụứừửữựýỳỷỹỵ]', text.lower()))
-        english_hits = sum(1 for w in words if w in self._ENGLISH_STOPWORDS)
-        english_ratio = english_hits / max(len(words), 1)
+        if words is None:
+            words = self._tokenize_words(text)
+        if not words:
+            return False
 
-        if not has_vietnamese_chars and english_ratio >= 0.18:
-            return True
+        # Stop counting once the English ratio threshold is reached
+        threshold = 0.18 * len(words)
+        english_hits = 0
+        for word in words:
+            if word in self._ENGLISH_STOPWORDS:
+                english_hits += 1
+                if english_hits >= threshold:
+                    return True
 
         return False
 
@@ -878,24 +1401,28 @@ class LyricsExtractionServiceLegacy:
         if not text:
             return None
 
-        # Remove common hallucinations (YouTube prompts, channel names, etc.)
-        text = self._filter_hallucinations(text)
-        
-        normalized_text = re.sub(r'\s+', ' ', text).strip()
+        # Remove common hallucinations (YouTube prompts, channel names, etc.).
+        # This also collapses whitespace, so the text is single-spaced from here on.
+        normalized_text = self._filter_hallucinations(text)
         if not normalized_text:
             return None
 
-        chunks = re.split(r'(?<=[.!?])\s+|\n+', normalized_text)
+        chunks = _CHUNK_SPLIT_RE.split(normalized_text)
         cleaned_chunks = []
+        # Words of the kept chunks, collected as we go; tokens never span the
+        # joining spaces, so this equals tokenizing the rebuilt text again
+        rebuilt_words = []
         chunk_counts = Counter()
         previous = None
 
         max_chunk_repeats = int(current_app.config.get('LYRICS_MAX_SAME_CHUNK_REPEATS', 2))
+        find_tokens = _TOKEN_RE.findall
         for chunk in chunks:
             candidate = chunk.strip(' ,;')
             if not candidate:
                 continue
-            key = self._normalize_for_repeat_check(candidate)
+            # Word tuple as the repeat key: one regex pass, compared without rejoining
+            key = tuple(find_tokens(candidate.lower()))
             if not key:
                 continue
             if key == previous:
@@ -904,17 +1431,18 @@ class LyricsExtractionServiceLegacy:
                 continue
             chunk_counts[key] += 1
             cleaned_chunks.append(candidate)
+            rebuilt_words.extend(key)
             previous = key
 
         if not cleaned_chunks:
             return None
 
         rebuilt = ' '.join(cleaned_chunks)
-        rebuilt_words = self._tokenize_words(rebuilt)
         if self._has_excessive_ngram_repetition(rebuilt_words, n=3):
             rebuilt = self._dedupe_rolling_ngrams(rebuilt_words, n=3)
 
-        rebuilt = re.sub(r'\s+', ' ', rebuilt).strip(' ,;')
+        # Chunks and deduped words are joined with single spaces already
+        rebuilt = rebuilt.strip(' ,;')
         
         # Add line breaks for better readability
         rebuilt = self._add_line_breaks(rebuilt)
@@ -923,30 +1451,11 @@ class LyricsExtractionServiceLegacy:
     
     def _filter_hallucinations(self, text: str) -> str:
         """Remove common hallucination patterns from transcription."""
-        hallucination_patterns = [
-            # YouTube/social media prompts (Vietnamese)
-            r'[Hh]ãy\s+subscribe\s+.*?(?:kênh|channel).*?(?:\.|$)',
-            r'[Đđ]ừng\s+quên\s+(?:đăng\s+ký|subscribe).*?(?:\.|$)',
-            r'[Nn]hấn\s+(?:like|subscribe|đăng\s+ký).*?(?:\.|$)',
-            r'[Tt]heo\s+dõi\s+kênh.*?(?:\.|$)',
-            r'[Cc]ảm\s+ơn\s+(?:các\s+)?bạn\s+đã\s+(?:xem|theo\s+dõi).*?(?:\.|$)',
-            r'[Đđ]ể\s+không\s+bỏ\s+lỡ.*?(?:video|clip).*?(?:\.|$)',
-            r'[Gg]hiền\s+[Mm]ì\s+[Gg]õ.*?(?:\.|$)',
-            # English versions
-            r'[Pp]lease\s+subscribe.*?(?:\.|$)',
-            r'[Dd]on\'t\s+forget\s+to\s+(?:like|subscribe).*?(?:\.|$)',
-            r'[Hh]it\s+the\s+(?:bell|like|subscribe).*?(?:\.|$)',
-            r'[Tt]hanks\s+for\s+watching.*?(?:\.|$)',
-            # Generic channel/intro/outro markers
-            r'\[.*?(?:[Mm]usic|[Ii]ntro|[Oo]utro).*?\]',
-            r'♪.*?♪',
-        ]
-        
-        for pattern in hallucination_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for pattern in _HALLUCINATION_PATTERNS:
+            text = pattern.sub('', text)
         
         # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         return text
     
     def _add_line_breaks(self, text: str) -> str:
@@ -954,33 +1463,25 @@ class LyricsExtractionServiceLegacy:
         if not text:
             return text
             
-        # Split into sentences or approximate lines
+        # Split into sentences or approximate lines; only the break positions
+        # are tracked, and each line is joined from one slice of the word list
         words = text.split()
         lines = []
-        current_line = []
-        word_count = 0
+        line_start = 0
         
-        for word in words:
-            current_line.append(word)
-            word_count += 1
+        for index, word in enumerate(words):
+            word_count = index - line_start + 1
             
-            # Add line break after 8-12 words, or at sentence boundaries
-            ends_sentence = word.rstrip(',;').endswith(('.', '!', '?'))
-            
-            if ends_sentence and word_count >= 4:
-                # End line at sentence boundary if we have at least 4 words
-                lines.append(' '.join(current_line))
-                current_line = []
-                word_count = 0
-            elif word_count >= 10:
-                # Force line break after ~10 words
-                lines.append(' '.join(current_line))
-                current_line = []
-                word_count = 0
+            # Add line break after 8-12 words, or at sentence boundaries:
+            # end at a sentence boundary once the line has at least 4 words,
+            # otherwise force a break after ~10 words
+            if word_count >= 10 or (word_count >= 4 and word.rstrip(',;').endswith(('.', '!', '?'))):
+                lines.append(' '.join(words[line_start:index + 1]))
+                line_start = index + 1
         
         # Add remaining words
-        if current_line:
-            lines.append(' '.join(current_line))
+        if line_start < len(words):
+            lines.append(' '.join(words[line_start:]))
         
         return '\n'.join(lines)
 
@@ -994,19 +1495,36 @@ class LyricsExtractionServiceLegacy:
             return text
 
         corrected = text
-        for pattern, replacement in self._VIETNAMESE_COMMON_FIXES:
-            corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
-
-        custom_fixes = self._get_vietnamese_custom_corrections()
-        for wrong, right in custom_fixes.items():
-            corrected = re.sub(re.escape(wrong), right, corrected, flags=re.IGNORECASE)
+        for pattern, replacement in self._get_vietnamese_corrections():
+            corrected = pattern.sub(replacement, corrected)
 
         # Collapse horizontal whitespace only, preserve line breaks
-        corrected = re.sub(r'[^\S\n]+', ' ', corrected)
-        corrected = re.sub(r'\n{3,}', '\n\n', corrected)
+        corrected = _HORIZONTAL_WHITESPACE_RE.sub(' ', corrected)
+        corrected = _EXCESS_NEWLINES_RE.sub('\n\n', corrected)
         corrected = corrected.strip()
         return corrected or text
 
+    def _get_vietnamese_corrections(self):
+        """
+        Return the compiled (pattern, replacement) pairs for every Vietnamese fix.
+
+        Built-in fixes come first, then the configured custom corrections in
+        config order. Each applies to the previous one's output, so a custom
+        phrase can build on a built-in fix. Custom patterns are compiled only
+        when the config JSON changes.
+        """
+        raw_json = current_app.config.get('LYRICS_VI_CUSTOM_CORRECTIONS_JSON') or ''
+        cached_source, cached_fixes = LyricsExtractionServiceLegacy._custom_corrections_cache
+        if cached_source == raw_json and cached_fixes is not None:
+            return cached_fixes
+
+        fixes = _VIETNAMESE_COMMON_FIXES + tuple(
+            (re.compile(re.escape(wrong), re.IGNORECASE), right)
+            for wrong, right in self._get_vietnamese_custom_corrections().items()
+        )
+        LyricsExtractionServiceLegacy._custom_corrections_cache = (raw_json, fixes)
+        return fixes
+
     def _get_vietnamese_custom_corrections(self):
         raw_json = current_app.config.get('LYRICS_VI_CUSTOM_CORRECTIONS_JSON')
         if not raw_json:
@@ -1033,30 +1551,52 @@ class LyricsExtractionServiceLegacy:
         if len(words) < n * 2:
             return False
 
-        ngrams = [' '.join(words[i:i + n]) for i in range(len(words) - n + 1)]
-        if not ngrams:
-            return False
-
-        most_common_count = Counter(ngrams).most_common(1)[0][1]
+        total_ngrams = len(words) - n + 1
         max_ratio = float(current_app.config.get('LYRICS_MAX_REPEATED_NGRAM_RATIO', 0.08))
-        return (most_common_count / max(len(ngrams), 1)) > max_ratio
+        max_count = max_ratio * total_ngrams
+
+        # Count tuple n-grams and stop as soon as any one crosses the limit
+        counts = {}
+        for ngram in zip(*(words[i:] for i in range(n))):
+            count = counts.get(ngram, 0) + 1
+            if count > max_count:
+                return True
+            counts[ngram] = count
+        return False
 
     @staticmethod
     def _dedupe_rolling_ngrams(words, n: int = 3) -> str:
         if len(words) < n * 2:
             return ' '.join(words)
 
+        # Encode each n-gram as one exact integer over per-word ids so the
+        # window can roll forward in O(1) instead of building a tuple per index
+        word_ids = {}
+        ids = [word_ids.setdefault(word, len(word_ids)) for word in words]
+        base = len(word_ids)
+        high = base ** (n - 1)
+        total = len(words)
+
         output = []
         seen_ngrams = set()
+        key = None
         i = 0
-        while i < len(words):
-            if i + n <= len(words):
-                ngram = tuple(words[i:i + n])
-                if ngram in seen_ngrams:
+        while i < total:
+            if i + n <= total:
+                if key is None:
+                    key = 0
+                    for word_id in ids[i:i + n]:
+                        key = key * base + word_id
+                if key in seen_ngrams:
                     i += n
+                    key = None
                     continue
-                seen_ngrams.add(ngram)
+                seen_ngrams.add(key)
             output.append(words[i])
+            if key is not None and i + n < total:
+                key = (key - ids[i] * high) * base + ids[i + n]
+            else:
+                key = None
             i += 1
 
         return ' '.join(output)
@@ -1065,51 +1605,69 @@ class LyricsExtractionServiceLegacy:
     def _tokenize_words(text: str):
         # Support Vietnamese and other Unicode characters, not just English a-z
         # Match sequences of letters (including Unicode) and apostrophes
-        return re.findall(r"[\w']+", text.lower(), re.UNICODE)
+        return _TOKEN_RE.findall(text.lower())
 
-    @staticmethod
-    def _normalize_for_repeat_check(text: str) -> str:
-        # Preserve Unicode characters (Vietnamese, etc.), only remove punctuation except apostrophes
-        # Keep letters (Unicode), digits, apostrophes, and spaces
-        cleaned = re.sub(r"[^\w\s']", '', text.lower(), flags=re.UNICODE)
-        return re.sub(r"\s+", ' ', cleaned).strip()
-    
     def _download_audio_file(self, audio_url: str, temp_dir: str) -> str:
         """Download remote audio URL to a temporary local file."""
         max_size_mb = int(current_app.config.get('LYRICS_MAX_DOWNLOAD_MB', 30))
         max_size_bytes = max_size_mb * 1024 * 1024
 
-        response = requests.get(audio_url, stream=True, timeout=45)
-        response.raise_for_status()
-
-        extension = self._guess_extension_helper(audio_url, response.headers.get('Content-Type', ''))
-        local_file_path = os.path.join(temp_dir, f'input{extension}')
+        # Close the streamed response so its connection returns to the pool
+        with self._session.get(audio_url, stream=True, timeout=(5, 45)) as response:
+            response.raise_for_status()
 
-        bytes_written = 0
-        with open(local_file_path, 'wb') as out_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                if not chunk:
-                    continue
-                bytes_written += len(chunk)
-                if bytes_written > max_size_bytes:
-                    raise ValueError(f'Audio file exceeds limit of {max_size_mb}MB')
-                out_file.write(chunk)
+            # Reject oversized files up front when the server declares the size
+            declared_length = response.headers.get('Content-Length')
+            if declared_length and declared_length.isdigit() and int(declared_length) > max_size_bytes:
+                raise ValueError(f'Audio file exceeds limit of {max_size_mb}MB')
+
+            extension = self._guess_extension_helper(audio_url, response.headers.get('Content-Type', ''))
+            local_file_path = os.path.join(temp_dir, f'input{extension}')
+
+            # Let the C-level copy loop drive the transfer; the writer enforces the cap
+            response.raw.decode_content = True
+            with open(local_file_path, 'wb', buffering=_DOWNLOAD_WRITE_BUFFER_SIZE) as out_file:
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(out_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+
+                # Reserve the declared size up front so the file is laid out in one go
+                preallocated = False
+                if declared_length and declared_length.isdigit() and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(out_file.fileno(), 0, int(declared_length))
+                        preallocated = True
+                    except OSError:
+                        pass
+
+                shutil.copyfileobj(
+                    response.raw,
+                    _CappedWriter(out_file, max_size_bytes, f'Audio file exceeds limit of {max_size_mb}MB'),
+                    _DOWNLOAD_CHUNK_SIZE
+                )
+                if preallocated:
+                    # Decoded bodies can be shorter than the declared length
+                    out_file.truncate()
 
         return local_file_path
     
     @staticmethod
     def _guess_extension_helper(audio_url: str, content_type: str) -> str:
+        # Also matches extensions followed by a query string (presigned URLs)
+        match = _URL_EXTENSION_RE.search(audio_url or '')
+        if match:
+            return _URL_SUFFIX_EXTENSIONS[match.group(1).lower()]
         lower_content = (content_type or '').lower()
-        if 'mpeg' in lower_content or audio_url.lower().endswith('.mp3'):
-            return '.mp3'
-        if 'wav' in lower_content or audio_url.lower().endswith('.wav'):
-            return '.wav'
-        if 'flac' in lower_content or audio_url.lower().endswith('.flac'):
-            return '.flac'
-        if 'ogg' in lower_content or audio_url.lower().endswith('.ogg'):
-            return '.ogg'
-        if 'mp4' in lower_content or audio_url.lower().endswith('.m4a'):
-            return '.m4a'
+        # 'audio/mpeg; charset=...' -> 'mpeg'
+        subtype = lower_content.partition('/')[2].partition(';')[0].strip()
+        extension = _CONTENT_SUBTYPE_EXTENSIONS.get(subtype)
+        if extension:
+            return extension
+        for token, extension in _CONTENT_TYPE_EXTENSIONS:
+            if token in lower_content:
+                return extension
         return '.tmp'
 
     @staticmethod
@@ -1117,14 +1675,18 @@ class LyricsExtractionServiceLegacy:
         if value is None:
             return None
 
+        # Plain text frames are the common case
+        if type(value) is str:
+            return value.strip() or None
+
         if isinstance(value, list):
-            normalized = '\n'.join(str(v) for v in value if v is not None).strip()
+            normalized = '\n'.join(map(str, filter(_is_not_none, value))).strip()
             return normalized or None
 
-        if hasattr(value, 'text'):
-            text_value = getattr(value, 'text')
+        text_value = getattr(value, 'text', _MISSING)
+        if text_value is not _MISSING:
             if isinstance(text_value, list):
-                normalized = '\n'.join(str(v) for v in text_value if v is not None).strip()
+                normalized = '\n'.join(map(str, filter(_is_not_none, text_value))).strip()
                 return normalized or None
             normalized = str(text_value).strip()
             return normalized or None
@@ -1145,14 +1707,19 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
     - Support for synced lyrics (LRC format)
     """
     
-    def extract_lyrics(
+    # Searches currently running in this process, keyed by their inputs, so
+    # concurrent jobs for the same track share one set of LRCLIB requests
+    _inflight_searches: Dict[Tuple, Future] = {}
+    _inflight_lock = Lock()
+    
+    def _run_tiers(
         self,
-        audio_url: Optional[str] = None,
-        local_file_path: Optional[str] = None,
+        target_path: str,
+        temp_dir: str,
         whisper_language_override: Optional[str] = None
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
-        Extract lyrics using enhanced multi-tier fallback chain.
+        Run the enhanced multi-tier fallback chain.
 
         Tier 1: Embedded metadata (free, instant)
         Tier 2a: Cache lookup (instant)
@@ -1162,86 +1729,68 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
         Returns:
             Tuple of (lyrics, source, error)
         """
-        if not current_app.config.get('LYRICS_EXTRACTION_ENABLED', True):
-            return None, None, 'Lyrics extraction is disabled'
-
-        if not audio_url and not local_file_path:
-            return None, None, 'No audio source provided'
-
-        temp_dir = tempfile.mkdtemp(prefix='lyrics_extract_')
-        try:
-            # Resolve audio file path
-            target_path = local_file_path
-            if not target_path:
-                target_path = self._download_audio_file(audio_url, temp_dir)
-
-            # --- Tier 1: Embedded metadata ---
-            metadata_lyrics = self._extract_metadata_lyrics(target_path)
-            if metadata_lyrics:
-                current_app.logger.info('Lyrics resolved via Tier 1: embedded metadata')
-                return metadata_lyrics, 'metadata', None
-
-            # Extract artist/title for LRCLIB lookup
-            artist, title = self._extract_artist_title(target_path)
+        # --- Tier 1: Embedded metadata ---
+        metadata_lyrics = self._extract_metadata_lyrics(target_path)
+        if metadata_lyrics:
+            current_app.logger.info('Lyrics resolved via Tier 1: embedded metadata')
+            return metadata_lyrics, 'metadata', None
+
+        # Extract artist/title for LRCLIB lookup
+        artist, title = self._extract_artist_title(target_path)
+        
+        # --- Tier 2a: Cache lookup ---
+        if artist and title:
+            cached_lyrics = LyricsCacheManager.get_cached_lyrics(artist, title)
+            if cached_lyrics:
+                current_app.logger.info('Lyrics resolved via Tier 2a: cache')
+                return cached_lyrics['lyrics'], 'lrclib_cache', None
+
+        # --- Tier 2b: Enhanced LRCLIB API lookup ---
+        lrclib_lyrics, lrclib_metadata = self._lookup_lyrics_lrclib_enhanced(
+            target_path, artist, title
+        )
+        if lrclib_lyrics:
+            current_app.logger.info('Lyrics resolved via Tier 2b: LRCLIB (enhanced)')
             
-            # --- Tier 2a: Cache lookup ---
-            if artist and title:
-                cached_lyrics = LyricsCacheManager.get_cached_lyrics(artist, title)
-                if cached_lyrics:
-                    current_app.logger.info('Lyrics resolved via Tier 2a: cache')
-                    return cached_lyrics['lyrics'], 'lrclib_cache', None
-
-            # --- Tier 2b: Enhanced LRCLIB API lookup ---
-            lrclib_lyrics, lrclib_metadata = self._lookup_lyrics_lrclib_enhanced(
-                target_path, artist, title
-            )
-            if lrclib_lyrics:
-                current_app.logger.info('Lyrics resolved via Tier 2b: LRCLIB (enhanced)')
-                
-                # Cache the result
-                if artist and title and lrclib_metadata:
-                    LyricsCacheManager.cache_lyrics(
-                        artist=artist,
-                        title=title,
-                        lyrics_text=lrclib_lyrics,
-                        synced_lyrics=lrclib_metadata.get('synced_lyrics'),
-                        lrclib_id=lrclib_metadata.get('id'),
-                        album_name=lrclib_metadata.get('album_name'),
-                        duration=lrclib_metadata.get('duration'),
-                        match_score=lrclib_metadata.get('match_score')
-                    )
-                
-                return lrclib_lyrics, 'lrclib', None
-
-            # --- Tier 3: AssemblyAI transcription ---
-            # (Keep existing implementation from parent class)
-            transcription_target = target_path
-            if current_app.config.get('LYRICS_VOCAL_SEPARATION_ENABLED', False):
-                separated_path = self._separate_vocals_with_demucs(target_path, temp_dir)
-                if separated_path:
-                    transcription_target = separated_path
-
-            raw_lyrics = self._transcribe_with_assemblyai(
-                transcription_target,
-                language_override=whisper_language_override,
-            )
-
-            if raw_lyrics:
-                cleaned = self._postprocess_lyrics(raw_lyrics)
-                language = whisper_language_override or current_app.config.get('LYRICS_WHISPER_LANGUAGE')
-                final = self._apply_language_post_corrections(cleaned, language)
+            # Cache the result
+            if artist and title and lrclib_metadata:
+                LyricsCacheManager.cache_lyrics(
+                    artist=artist,
+                    title=title,
+                    lyrics_text=lrclib_lyrics,
+                    synced_lyrics=lrclib_metadata.get('synced_lyrics'),
+                    lrclib_id=lrclib_metadata.get('id'),
+                    album_name=lrclib_metadata.get('album_name'),
+                    duration=lrclib_metadata.get('duration'),
+                    match_score=lrclib_metadata.get('match_score')
+                )
+            
+            return lrclib_lyrics, 'lrclib', None
+
+        # --- Tier 3: AssemblyAI transcription ---
+        # (Keep existing implementation from parent class)
+        transcription_target = target_path
+        app_config = current_app.config
+        if app_config.get('LYRICS_VOCAL_SEPARATION_ENABLED', False):
+            separated_path = self._separate_vocals_with_demucs(target_path, temp_dir)
+            if separated_path:
+                transcription_target = separated_path
+
+        raw_lyrics = self._transcribe_with_assemblyai(
+            transcription_target,
+            language_override=whisper_language_override,
+        )
 
-                if final and self._is_transcription_usable(final, expected_language=language):
-                    current_app.logger.info('Lyrics resolved via Tier 3: AssemblyAI')
-                    return final, 'assemblyai', None
+        if raw_lyrics:
+            cleaned = self._postprocess_lyrics(raw_lyrics)
+            language = whisper_language_override or app_config.get('LYRICS_WHISPER_LANGUAGE')
+            final = self._apply_language_post_corrections(cleaned, language)
 
-            return None, None, 'No lyrics detected from all tiers'
+            if final and self._is_transcription_usable(final, expected_language=language):
+                current_app.logger.info('Lyrics resolved via Tier 3: AssemblyAI')
+                return final, 'assemblyai', None
 
-        except Exception as exc:
-            current_app.logger.warning(f'Lyrics extraction failed: {exc}')
-            return None, None, str(exc)
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        return None, None, 'No lyrics detected from all tiers'
     
     def _lookup_lyrics_lrclib_enhanced(
         self,
@@ -1255,58 +1804,29 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
         Returns:
             Tuple of (lyrics_text, metadata)
         """
-        if not current_app.config.get('LYRICS_USE_LRCLIB', False):
+        app_config = current_app.config
+        if not app_config.get('LYRICS_USE_LRCLIB', False):
             return None, None
 
         if not title:
             current_app.logger.debug('Missing title, skipping LRCLIB lookup')
             return None, None
 
-        client = LRCLIBClient()
-        
         # Extract additional metadata for better matching
         duration = self._extract_duration(audio_path)
         album = self._extract_album(audio_path)
         
-        # Strategy 1: Search with all available metadata
-        results = client.search_lyrics(
-            track_name=title,
-            artist_name=artist,
-            album_name=album,
-            duration=duration
-        )
-        
-        if not results:
-            # Strategy 2: Try without artist (broaden search)
-            if artist:
-                current_app.logger.debug('Retrying LRCLIB search without artist')
-                results = client.search_lyrics(
-                    track_name=title,
-                    album_name=album,
-                    duration=duration
-                )
-        
-        if not results:
-            # Strategy 3: Try with cleaned/simplified title
-            cleaned_title = self._clean_track_title(title)
-            if cleaned_title != title:
-                current_app.logger.debug(f'Retrying with cleaned title: {cleaned_title}')
-                results = client.search_lyrics(
-                    track_name=cleaned_title,
-                    artist_name=artist,
-                    duration=duration
-                )
+        best_match = self._search_lrclib_best_match_shared(title, artist, album, duration)
         
-        if not results:
+        if not best_match:
             current_app.logger.debug(f'No LRCLIB results for "{title}"')
             return None, None
         
-        # Get best match (highest score)
-        best_match = results[0]
+        # Best match (highest score)
         match_score = best_match.get('match_score', 0)
         
         # Only accept matches with reasonable confidence
-        min_score = float(current_app.config.get('LRCLIB_MIN_MATCH_SCORE', 50.0))
+        min_score = float(app_config.get('LRCLIB_MIN_MATCH_SCORE', 50.0))
         if match_score < min_score:
             current_app.logger.info(
                 f'LRCLIB best match score {match_score:.1f} below threshold {min_score}'
@@ -1325,7 +1845,7 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
         lyrics_text = plain_lyrics  # Use plain for now
         
         # Parse synced lyrics if needed
-        if synced_lyrics and current_app.config.get('LRCLIB_USE_SYNCED_LYRICS', False):
+        if synced_lyrics and app_config.get('LRCLIB_USE_SYNCED_LYRICS', False):
             parsed_plain = self._parse_lrc_to_plain(synced_lyrics)
             if parsed_plain:
                 lyrics_text = parsed_plain
@@ -1353,13 +1873,92 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
         
         return lyrics_text, metadata
     
+    def _search_lrclib_best_match_shared(
+        self,
+        title: str,
+        artist: Optional[str],
+        album: Optional[str],
+        duration: Optional[int]
+    ) -> Optional[Dict]:
+        """
+        Run the LRCLIB search strategies once per distinct query in flight.
+        
+        The first caller for a query performs the searches; concurrent callers
+        with the same inputs wait for and reuse its result.
+        """
+        key = (title.lower(), (artist or '').lower(), (album or '').lower(), duration)
+        
+        with self._inflight_lock:
+            future = self._inflight_searches.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight_searches[key] = future
+        
+        if not is_owner:
+            current_app.logger.debug(f'Waiting for in-flight LRCLIB search for "{title}"')
+            return future.result()
+        
+        try:
+            best_match = self._search_lrclib_best_match(title, artist, album, duration)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(best_match)
+            return best_match
+        finally:
+            with self._inflight_lock:
+                self._inflight_searches.pop(key, None)
+    
+    def _search_lrclib_best_match(
+        self,
+        title: str,
+        artist: Optional[str],
+        album: Optional[str],
+        duration: Optional[int]
+    ) -> Optional[Dict]:
+        """Try progressively broader LRCLIB searches until one yields a match."""
+        client = LRCLIBClient()
+        
+        # Strategy 1: Search with all available metadata
+        best_match = client.search_best_match(
+            track_name=title,
+            artist_name=artist,
+            album_name=album,
+            duration=duration
+        )
+        
+        if not best_match:
+            # Strategy 2: Try without artist (broaden search)
+            if artist:
+                current_app.logger.debug('Retrying LRCLIB search without artist')
+                best_match = client.search_best_match(
+                    track_name=title,
+                    album_name=album,
+                    duration=duration
+                )
+        
+        if not best_match:
+            # Strategy 3: Try with cleaned/simplified title
+            cleaned_title = self._clean_track_title(title)
+            if cleaned_title != title:
+                current_app.logger.debug(f'Retrying with cleaned title: {cleaned_title}')
+                best_match = client.search_best_match(
+                    track_name=cleaned_title,
+                    artist_name=artist,
+                    duration=duration
+                )
+        
+        return best_match
+    
     def _extract_duration(self, audio_path: str) -> Optional[int]:
         """Extract audio duration in seconds."""
+        if mutagen_file_loader is None:
+            return None
+
         try:
-            mutagen_module = importlib.import_module('mutagen')
-            mutagen_file_loader = getattr(mutagen_module, 'File')
-            
-            audio_file = mutagen_file_loader(audio_path)
+            audio_file = self._load_audio_file(audio_path)
             if audio_file and hasattr(audio_file.info, 'length'):
                 return int(audio_file.info.length)
         except Exception as exc:
@@ -1369,11 +1968,11 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
     
     def _extract_album(self, audio_path: str) -> Optional[str]:
         """Extract album name from metadata."""
+        if mutagen_file_loader is None:
+            return None
+
         try:
-            mutagen_module = importlib.import_module('mutagen')
-            mutagen_file_loader = getattr(mutagen_module, 'File')
-            
-            audio_file = mutagen_file_loader(audio_path)
+            audio_file = self._load_audio_file(audio_path)
             if not audio_file or not getattr(audio_file, 'tags', None):
                 return None
             
@@ -1411,11 +2010,11 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
             return title
         
         # Remove parentheticals (Remix), [feat. Artist], etc.
-        cleaned = re.sub(r'\([^)]*(?:remix|radio edit|album version|live)[^)]*\)', '', title, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\[[^\]]*feat[^\]]*\]', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _TITLE_VERSION_SUFFIX_RE.sub('', title)
+        cleaned = _TITLE_FEATURING_RE.sub('', cleaned)
         
         # Remove trailing dashes or other noise
-        cleaned = re.sub(r'\s*[-–—]\s*$', '', cleaned)
+        cleaned = _TITLE_TRAILING_DASH_RE.sub('', cleaned)
         
         # Normalize whitespace
         cleaned = ' '.join(cleaned.split())
@@ -1432,11 +2031,9 @@ class LyricsExtractionServiceEnhanced(LyricsExtractionServiceLegacy):
         if not lrc_content:
             return None
         
-        lines = []
-        for line in lrc_content.split('\n'):
-            # Remove timestamp markers
-            cleaned = re.sub(r'\[\d+:\d+\.\d+\]', '', line).strip()
-            if cleaned:
-                lines.append(cleaned)
+        # Remove timestamp markers from the whole text in one pass; they never
+        # span a line break, so this matches stripping line by line
+        stripped = _LRC_TIMESTAMP_RE.sub('', lrc_content)
+        lines = [line for line in map(str.strip, stripped.splitlines()) if line]
         
         return '\n'.join(lines) if lines else None
@@ -1,17 +1,90 @@
 import os
 import json
+from threading import Lock
 from typing import List, Dict, Any, Optional
 from flask import current_app
 from app.core.utils import JSONUtils
 
+# Joins a template's lowercased search fields into one string; a control
+# character that never appears in template text, so matches cannot span fields
+_SEARCH_FIELD_SEPARATOR = '\x1f'
+
+
+def _build_lookup_index(templates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the id, category, subcategory, tag and popularity tables in one pass."""
+    by_id = {}
+    by_category = {}
+    subcategories = set()
+    subcategories_by_category = {}
+    tags = set()
+    total_popularity = 0
+
+    for template in templates:
+        # First template wins on duplicate ids, as with a linear scan
+        by_id.setdefault(template.get('id'), template)
+        category = template.get('category')
+        if category:
+            by_category.setdefault(category, []).append(template)
+        subcategory = template.get('subcategory')
+        if subcategory:
+            subcategories.add(subcategory)
+            if category:
+                subcategories_by_category.setdefault(category, set()).add(subcategory)
+        tags.update(template.get('tags', []))
+        total_popularity += template.get('popularity', 0)
+
+    return {
+        'by_id': by_id,
+        'by_category': by_category,
+        'categories': sorted(by_category),
+        'subcategories': sorted(subcategories),
+        'subcategories_by_category': {
+            category: sorted(names) for category, names in subcategories_by_category.items()
+        },
+        'tags': sorted(tags),
+        'total_popularity': total_popularity,
+    }
+
+
+def _build_search_blobs(templates: List[Dict[str, Any]]) -> List[str]:
+    """Lowercase each template's searchable fields once, in template order."""
+    return [
+        _SEARCH_FIELD_SEPARATOR.join([
+            template.get('name', '').lower(),
+            template.get('description', '').lower(),
+            template.get('style', '').lower(),
+            *(tag.lower() for tag in template.get('tags', [])),
+        ])
+        for template in templates
+    ]
+
+
+def _build_tags_lower(templates: List[Dict[str, Any]]) -> Dict[int, frozenset]:
+    """Lowercased tag sets keyed by object identity; the templates live as long as the cache."""
+    return {id(template): frozenset(tag.lower() for tag in template.get('tags', [])) for template in templates}
+
+
+_INDEX_BUILDERS = {
+    'lookup': _build_lookup_index,
+    'search_blobs': _build_search_blobs,
+    'tags_lower': _build_tags_lower,
+}
+
+
 class TemplateService:
     """
     Service to manage music generation templates and playlist templates.
     """
+
+    # Parsed templates and their indexes, shared by every instance (routes create
+    # one per request) and keyed by file path; reloaded when the file's mtime changes
+    _shared_entries: Dict[str, Dict[str, Any]] = {}
+    _shared_lock = Lock()
     
     def __init__(self):
         self.templates_file = self._get_templates_file_path()
         self._templates_cache = None
+        self._entry = None
 
     def _get_templates_file_path(self) -> str:
         """Get the path to the templates JSON file."""
@@ -21,15 +94,41 @@ class TemplateService:
             # Fallback for testing outside Flask context
             return os.path.join('app', 'static', 'templates', 'templates.json')
 
+    def _get_shared_entry(self) -> Dict[str, Any]:
+        """Return the shared templates entry for this file, reloading it if the file changed."""
+        try:
+            mtime = os.stat(self.templates_file).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with self._shared_lock:
+            entry = self._shared_entries.get(self.templates_file)
+            if entry is None or entry['mtime'] != mtime:
+                data = JSONUtils.load_json_file(self.templates_file, {"templates": []})
+                entry = {'mtime': mtime, 'templates': data.get("templates", []), 'indexes': {}}
+                self._shared_entries[self.templates_file] = entry
+            return entry
+
     def get_all_templates(self) -> List[Dict[str, Any]]:
         """Get all templates."""
         if self._templates_cache is not None:
             return self._templates_cache
             
-        data = JSONUtils.load_json_file(self.templates_file, {"templates": []})
-        templates = data.get("templates", [])
-        self._templates_cache = templates
-        return templates
+        self._entry = self._get_shared_entry()
+        self._templates_cache = self._entry['templates']
+        return self._templates_cache
+
+    def _get_index(self, name: str) -> Any:
+        """Return a lookup table over the cached templates, building it on first use."""
+        self.get_all_templates()
+        indexes = self._entry['indexes']
+        index = indexes.get(name)
+        if index is None:
+            with self._shared_lock:
+                index = indexes.get(name)
+                if index is None:
+                    index = indexes[name] = _INDEX_BUILDERS[name](self._entry['templates'])
+        return index
 
     def search_templates(self, query: str) -> List[Dict[str, Any]]:
         """Search templates by name, description, or tags."""
@@ -38,26 +137,27 @@ class TemplateService:
             return templates
             
         query = query.lower()
-        results = []
-        for template in templates:
-            if (query in template.get('name', '').lower() or 
-                query in template.get('description', '').lower() or 
-                query in template.get('style', '').lower() or
-                any(query in tag.lower() for tag in template.get('tags', []))):
-                results.append(template)
-        return results
+        if _SEARCH_FIELD_SEPARATOR in query:
+            return []
+        search_blobs = self._get_index('search_blobs')
+        return [template for template, blob in zip(templates, search_blobs) if query in blob]
 
     def filter_templates(self, category: str = None, subcategory: str = None, 
                         difficulty: str = None, min_popularity: int = None, 
                         max_popularity: int = None, tags: List[str] = None,
                         instrumental: bool = None) -> List[Dict[str, Any]]:
         """Filter templates by various criteria."""
-        templates = self.get_all_templates()
+        if category:
+            # Start from the category's templates instead of scanning them all
+            templates = self._get_index('lookup')['by_category'].get(category, [])
+        else:
+            templates = self.get_all_templates()
+        if tags:
+            wanted_tags = {tag.lower() for tag in tags}
+            tags_lower = self._get_index('tags_lower')
         filtered = []
         
         for template in templates:
-            if category and template.get('category') != category:
-                continue
             if subcategory and template.get('subcategory') != subcategory:
                 continue
             if difficulty and template.get('difficulty') != difficulty:
@@ -68,10 +168,8 @@ class TemplateService:
                 continue
             if instrumental is not None and template.get('instrumental') != instrumental:
                 continue
-            if tags:
-                template_tags = set(t.lower() for t in template.get('tags', []))
-                if not any(tag.lower() in template_tags for tag in tags):
-                    continue
+            if tags and tags_lower[id(template)].isdisjoint(wanted_tags):
+                continue
             
             filtered.append(template)
             
@@ -89,36 +187,22 @@ class TemplateService:
 
     def get_template_by_id(self, template_id: str) -> Optional[Dict[str, Any]]:
         """Get a template by ID."""
-        templates = self.get_all_templates()
-        for template in templates:
-            if template.get('id') == template_id:
-                return template
-        return None
+        return self._get_index('lookup')['by_id'].get(template_id)
 
     def get_categories(self) -> List[str]:
         """Get list of unique categories."""
-        templates = self.get_all_templates()
-        return sorted(list(set(t.get('category') for t in templates if t.get('category'))))
+        return list(self._get_index('lookup')['categories'])
 
     def get_subcategories(self, category: str = None) -> List[str]:
         """Get list of unique subcategories, optionally filtered by category."""
-        templates = self.get_all_templates()
-        subcategories = set()
-        for t in templates:
-            if category and t.get('category') != category:
-                continue
-            if t.get('subcategory'):
-                subcategories.add(t.get('subcategory'))
-        return sorted(list(subcategories))
+        indexes = self._get_index('lookup')
+        if category:
+            return list(indexes['subcategories_by_category'].get(category, []))
+        return list(indexes['subcategories'])
 
     def get_tags(self) -> List[str]:
         """Get list of all unique tags."""
-        templates = self.get_all_templates()
-        tags = set()
-        for t in templates:
-            for tag in t.get('tags', []):
-                tags.add(tag)
-        return sorted(list(tags))
+        return list(self._get_index('lookup')['tags'])
 
     def get_templates_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get all templates in a category."""
@@ -127,17 +211,21 @@ class TemplateService:
     def get_template_stats(self) -> Dict[str, Any]:
         """Get statistics about templates."""
         templates = self.get_all_templates()
-        categories = self.get_categories()
+        indexes = self._get_index('lookup')
+        by_category = indexes['by_category']
         
         return {
             'total_count': len(templates),
-            'category_counts': {cat: len(self.get_templates_by_category(cat)) for cat in categories},
-            'avg_popularity': sum(t.get('popularity', 0) for t in templates) / len(templates) if templates else 0
+            'category_counts': {cat: len(by_category[cat]) for cat in indexes['categories']},
+            'avg_popularity': indexes['total_popularity'] / len(templates) if templates else 0
         }
 
     def clear_cache(self):
-        """Clear the templates cache."""
+        """Clear the templates cache and the indexes built from it."""
         self._templates_cache = None
+        self._entry = None
+        with self._shared_lock:
+            self._shared_entries.pop(self.templates_file, None)
 
     # --- Legacy/Playlist methods ---
 
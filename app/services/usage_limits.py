@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional, Tuple
 
 from flask import current_app, request
 from flask_login import current_user
-from sqlalchemy import func
+from sqlalchemy import case, func
 
 from app import db
 from app.models import UsageEvent
@@ -47,8 +47,14 @@ def _limits_for_actor(is_authenticated: bool) -> Tuple[Optional[int], Optional[i
     return daily_value, monthly_value
 
 
-def _usage_sum(*, user_id: Optional[str], ip_address: Optional[str], since: datetime) -> int:
-    q = db.session.query(func.coalesce(func.sum(UsageEvent.units), 0))
+def _usage_sums(
+    *, user_id: Optional[str], ip_address: Optional[str], day_start: datetime, month_start: datetime
+) -> Tuple[int, int]:
+    """Return (daily_used, monthly_used) in one query; the day lies within the month."""
+    q = db.session.query(
+        func.coalesce(func.sum(case((UsageEvent.created_at >= day_start, UsageEvent.units), else_=0)), 0),
+        func.coalesce(func.sum(UsageEvent.units), 0),
+    )
 
     if user_id:
         q = q.filter(UsageEvent.user_id == user_id)
@@ -58,8 +64,9 @@ def _usage_sum(*, user_id: Optional[str], ip_address: Optional[str], since: date
     if ip_address:
         q = q.filter(UsageEvent.ip_address == ip_address)
 
-    q = q.filter(UsageEvent.created_at >= since)
-    return int(q.scalar() or 0)
+    q = q.filter(UsageEvent.created_at >= month_start)
+    daily_used, monthly_used = q.one()
+    return int(daily_used or 0), int(monthly_used or 0)
 
 
 def check_allowed(units: int = 1) -> Tuple[bool, Dict[str, Any], int]:
@@ -82,8 +89,12 @@ def check_allowed(units: int = 1) -> Tuple[bool, Dict[str, Any], int]:
 
     daily_limit, monthly_limit = _limits_for_actor(is_auth)
 
-    daily_used = _usage_sum(user_id=user_id, ip_address=None if is_auth else ip_address, since=_window_start_daily(now))
-    monthly_used = _usage_sum(user_id=user_id, ip_address=None if is_auth else ip_address, since=_window_start_monthly(now))
+    daily_used, monthly_used = _usage_sums(
+        user_id=user_id,
+        ip_address=None if is_auth else ip_address,
+        day_start=_window_start_daily(now),
+        month_start=_window_start_monthly(now),
+    )
 
     daily_exceeded   = daily_limit   is not None and daily_used   + units > daily_limit
     monthly_exceeded = monthly_limit is not None and monthly_used + units > monthly_limit
@@ -20,6 +20,10 @@ import tarfile
 import zipfile
 import hashlib
 import json
+import re
+import shutil
+import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 import argparse
@@ -29,38 +33,48 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Read size for checksumming large archives on interpreters without hashlib.file_digest
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# tarfile's default gzip level; pigz uses the same so archives stay comparable in size
+GZIP_COMPRESS_LEVEL = 9
+
+# Backup exclusion rules, compiled once instead of rebuilt for every path.
+# Virtual environments anywhere below the root, and __pycache__ directories
+EXCLUDED_DIR_RE = re.compile(r'/(?:\.venv|venv|env|\.envs|__pycache__)/|/__pycache__$')
+EXCLUDED_SUFFIXES = ('.pyc', '.pyo')
+EXCLUDED_FILES = frozenset({
+    '.clinerules',  # Optional: include if you want to backup rules
+})
+# Development/test scripts: any file name containing one of these
+DEV_SCRIPT_RE = re.compile('|'.join(map(re.escape, [
+    'debug_', 'test_', 'diagnose_', 'fix_config', 'check_config',
+    'add_templates',
+    'generate_templates', 'merge_templates', 'create_new_templates',
+    'final_merge', 'final_add', 'add_missing', 'add_all_templates'
+])))
+
 def should_exclude(path: Path, root: Path) -> bool:
     """Determine if a path should be excluded from backup."""
     rel_path = str(path.relative_to(root)).replace('\\', '/')
-    
-    # Exclude virtual environments
-    if any(pattern in rel_path for pattern in ['/.venv/', '/venv/', '/env/', '/.envs/']):
-        return True
-    
-    # Exclude cache directories
-    if '/__pycache__/' in rel_path or rel_path.endswith('/__pycache__'):
+    return is_excluded_rel_path(rel_path, path.name)
+
+def is_excluded_rel_path(rel_path: str, name: str) -> bool:
+    """Exclusion rules for a '/'-separated path relative to the project root."""
+    # Exclude virtual environments and cache directories
+    if EXCLUDED_DIR_RE.search(rel_path):
         return True
     
     # Exclude Python cache files
-    if rel_path.endswith('.pyc') or rel_path.endswith('.pyo'):
+    if rel_path.endswith(EXCLUDED_SUFFIXES):
         return True
     
     # Exclude specific files
-    exclude_files = [
-        '.clinerules',  # Optional: include if you want to backup rules
-    ]
-    if os.path.basename(path) in exclude_files:
+    if name in EXCLUDED_FILES:
         return True
     
     # Exclude development/test scripts
-    dev_scripts = [
-        'debug_', 'test_', 'diagnose_', 'fix_config', 'check_config',
-        'add_templates',
-        'generate_templates', 'merge_templates', 'create_new_templates',
-        'final_merge', 'final_add', 'add_missing', 'add_all_templates'
-    ]
-    filename = path.name.lower()
-    if any(script in filename for script in dev_scripts):
+    if DEV_SCRIPT_RE.search(name.lower()):
         return True
     
     return False
@@ -72,20 +86,37 @@ def collect_backup_files(project_root: Path):
     
     logger.info(f"Scanning project: {project_root}")
     
-    for root_dir, dirs, files in os.walk(project_root):
-        root_path = Path(root_dir)
+    # Same top-down order and symlink handling as os.walk, but relative paths
+    # are built as strings while walking instead of via Path.relative_to()
+    def scan(dir_path: str, rel_dir: str):
+        nonlocal excluded_count
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return
         
-        # Filter directories to exclude
-        dirs[:] = [d for d in dirs if not should_exclude(root_path / d, project_root)]
-        
-        for file in files:
-            file_path = root_path / file
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
             
-            if should_exclude(file_path, project_root):
+            if is_dir:
+                # Filter directories to exclude; symlinked directories are not followed
+                if not is_excluded_rel_path(rel_path, entry.name) and not entry.is_symlink():
+                    subdirs.append((entry.path, rel_path))
+            elif is_excluded_rel_path(rel_path, entry.name):
                 excluded_count += 1
-                continue
-            
-            files_to_backup.append(file_path)
+            else:
+                files_to_backup.append(Path(entry.path))
+        
+        for subdir_path, subdir_rel in subdirs:
+            scan(subdir_path, subdir_rel)
+    
+    scan(str(project_root), '')
     
     logger.info(f"Found {len(files_to_backup)} files to backup")
     logger.info(f"Excluded {excluded_count} files/directories")
@@ -94,14 +125,38 @@ def collect_backup_files(project_root: Path):
 
 def calculate_checksum(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
-    sha256 = hashlib.sha256()
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read/update loop runs in C
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        sha256 = hashlib.sha256()
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
             sha256.update(chunk)
     return sha256.hexdigest()
 
-def create_backup_archive(files: list, project_root: Path, backup_dir: Path, format: str = 'tar') -> Path:
-    """Create compressed backup archive."""
+class HashingWriter:
+    """Write-only file wrapper that feeds every byte written into a SHA256 digest."""
+    
+    def __init__(self, file_obj):
+        self._file = file_obj
+        self.sha256 = hashlib.sha256()
+    
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return self._file.write(data)
+    
+    def flush(self):
+        self._file.flush()
+
+def create_backup_archive(files: list, project_root: Path, backup_dir: Path, format: str = 'tar') -> tuple:
+    """
+    Create compressed backup archive.
+    
+    Returns (backup_path, checksum). For tar.gz the SHA256 is computed while
+    the archive is written; zip archives are rewritten in place by zipfile,
+    so their checksum is None and must be computed afterwards.
+    """
+    checksum = None
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if format == 'zip':
@@ -118,20 +173,79 @@ def create_backup_archive(files: list, project_root: Path, backup_dir: Path, for
         backup_name = f"music_cover_backup_{timestamp}.tar.gz"
         backup_path = backup_dir / backup_name
         
-        with tarfile.open(backup_path, 'w:gz') as tar:
-            for file_path in files:
-                arcname = str(file_path.relative_to(project_root))
-                tar.add(file_path, arcname=arcname)
-                logger.debug(f"Added: {arcname}")
+        # Hash the compressed stream on its way to disk instead of re-reading it
+        with open(backup_path, 'wb') as out_file:
+            hashing_writer = HashingWriter(out_file)
+            pigz_path = shutil.which('pigz')
+            if pigz_path:
+                logger.info("Compressing with pigz (parallel gzip)")
+                write_tar_gz_with_pigz(files, project_root, hashing_writer, pigz_path)
+            else:
+                with tarfile.open(name=str(backup_path), mode='w:gz', fileobj=hashing_writer) as tar:
+                    add_files_to_tar(tar, files, project_root)
+        checksum = hashing_writer.sha256.hexdigest()
+    
+    return backup_path, checksum
+
+def add_files_to_tar(tar: tarfile.TarFile, files: list, project_root: Path):
+    """Add files to an open tar archive under their project-relative names."""
+    for file_path in files:
+        arcname = str(file_path.relative_to(project_root))
+        tar.add(file_path, arcname=arcname)
+        logger.debug(f"Added: {arcname}")
+
+def write_tar_gz_with_pigz(files: list, project_root: Path, out_file, pigz_path: str):
+    """
+    Stream an uncompressed tar into pigz and copy its gzip output to out_file.
+    
+    pigz compresses on all cores; the output is a standard .tar.gz.
+    """
+    proc = subprocess.Popen(
+        [pigz_path, f'-{GZIP_COMPRESS_LEVEL}', '-c'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    drain_errors = []
+    
+    def drain():
+        try:
+            shutil.copyfileobj(proc.stdout, out_file, CHECKSUM_CHUNK_SIZE)
+        except BaseException as e:
+            # Stop pigz so the tar writer fails on a broken pipe instead of blocking
+            drain_errors.append(e)
+            proc.kill()
+    
+    # Drain pigz concurrently so neither side of the pipe can block the other
+    drain_thread = threading.Thread(target=drain, daemon=True)
+    drain_thread.start()
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode='w|') as tar:
+            add_files_to_tar(tar, files, project_root)
+    except BaseException:
+        proc.kill()
+        if not drain_errors:
+            raise
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        drain_thread.join()
+        proc.stdout.close()
+        returncode = proc.wait()
     
-    return backup_path
+    if drain_errors:
+        raise drain_errors[0]
+    if returncode != 0:
+        raise RuntimeError(f"pigz exited with status {returncode}")
 
-def verify_backup_integrity(backup_path: Path) -> tuple:
-    """Verify backup archive integrity and calculate checksum."""
+def verify_backup_integrity(backup_path: Path, checksum: str = None) -> tuple:
+    """Verify backup archive integrity and calculate checksum unless already known."""
     logger.info(f"Verifying backup: {backup_path}")
     
-    # Calculate checksum
-    checksum = calculate_checksum(backup_path)
+    # Calculate checksum (skipped when it was streamed during creation)
+    if checksum is None:
+        checksum = calculate_checksum(backup_path)
     
     # Test archive can be opened
     try:
@@ -220,11 +334,11 @@ def main():
     
     # Create backup archive
     print(f"\n[INFO] Creating {args.format.upper()} backup archive...")
-    backup_path = create_backup_archive(files, project_root, backup_dir, args.format)
+    backup_path, checksum = create_backup_archive(files, project_root, backup_dir, args.format)
     
     # Verify integrity
     print("\n[INFO] Verifying backup integrity...")
-    integrity_ok, checksum, file_count = verify_backup_integrity(backup_path)
+    integrity_ok, checksum, file_count = verify_backup_integrity(backup_path, checksum)
     
     # Create metadata
     metadata_path = create_backup_metadata(
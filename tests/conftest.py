@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the unit tests.
+"""
+import os
+import sys
+
+import pytest
+
+# Make sure the project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app  # noqa: E402
+
+
+@pytest.fixture
+def app_context():
+    """An app with an in-memory database, inside an application context."""
+    app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'AUTO_CREATE_DB': False})
+    with app.app_context():
+        yield app
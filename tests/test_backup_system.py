@@ -0,0 +1,185 @@
+"""
+Unit tests for backup file collection and tar.gz backup creation: the
+SHA256 streamed while the archive is written must match a checksum of the
+finished file.
+"""
+import os
+import random
+import shutil
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import backup_system
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / 'project'
+    (root / 'app').mkdir(parents=True)
+    (root / 'app' / 'main.py').write_text('print("hello")\n', encoding='utf-8')
+    (root / 'README.md').write_text('# Project\n' * 1000, encoding='utf-8')
+    backup_dir = tmp_path / 'backups'
+    backup_dir.mkdir()
+    files = sorted(path for path in root.rglob('*') if path.is_file())
+    return root, backup_dir, files
+
+
+def assert_valid_backup(backup_path, checksum, files, root):
+    assert checksum == backup_system.calculate_checksum(backup_path)
+    with tarfile.open(backup_path, 'r:gz') as tar:
+        assert sorted(tar.getnames()) == sorted(str(path.relative_to(root)) for path in files)
+    assert backup_system.verify_backup_integrity(backup_path, checksum) == (True, checksum, len(files))
+
+
+def test_tar_gz_checksum_is_streamed(project, monkeypatch):
+    root, backup_dir, files = project
+    monkeypatch.setattr(backup_system.shutil, 'which', lambda name: None)
+
+    backup_path, checksum = backup_system.create_backup_archive(files, root, backup_dir, format='tar')
+
+    assert_valid_backup(backup_path, checksum, files, root)
+
+
+@pytest.mark.skipif(shutil.which('gzip') is None, reason='gzip is not installed')
+def test_tar_gz_checksum_is_streamed_through_pigz(project, monkeypatch):
+    root, backup_dir, files = project
+    # gzip takes the same -9 -c arguments, so it stands in for pigz
+    gzip_path = shutil.which('gzip')
+    monkeypatch.setattr(backup_system.shutil, 'which', lambda name: gzip_path if name == 'pigz' else None)
+
+    backup_path, checksum = backup_system.create_backup_archive(files, root, backup_dir, format='tar')
+
+    assert_valid_backup(backup_path, checksum, files, root)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='the stand-in pigz is a POSIX shell script')
+def test_pigz_failure_is_reported(project, tmp_path, monkeypatch):
+    root, backup_dir, files = project
+    failing_pigz = tmp_path / 'pigz'
+    failing_pigz.write_text('#!/bin/sh\ncat > /dev/null\nexit 3\n', encoding='utf-8')
+    failing_pigz.chmod(0o755)
+    monkeypatch.setattr(backup_system.shutil, 'which', lambda name: str(failing_pigz) if name == 'pigz' else None)
+
+    with pytest.raises(RuntimeError, match='status 3'):
+        backup_system.create_backup_archive(files, root, backup_dir, format='tar')
+
+
+def test_zip_checksum_is_left_to_verification(project):
+    root, backup_dir, files = project
+
+    backup_path, checksum = backup_system.create_backup_archive(files, root, backup_dir, format='zip')
+
+    assert checksum is None
+    assert backup_system.verify_backup_integrity(backup_path)[1] == backup_system.calculate_checksum(backup_path)
+
+
+def collect_backup_files_reference(project_root):
+    """The original os.walk and Path.relative_to implementation."""
+    files, excluded = [], 0
+    for root_dir, dirs, names in os.walk(project_root):
+        root_path = Path(root_dir)
+        dirs[:] = [d for d in dirs if not backup_system.should_exclude(root_path / d, project_root)]
+        for name in names:
+            file_path = root_path / name
+            if backup_system.should_exclude(file_path, project_root):
+                excluded += 1
+            else:
+                files.append(file_path)
+    return files, excluded
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    root = tmp_path / 'project'
+    for rel_path in [
+        'run.py', 'README.md', '.clinerules', 'test_api.py', 'Debug_upload.py',
+        'app/__init__.py', 'app/routes/main.py', 'app/__pycache__/main.cpython-311.pyc',
+        'app/static/templates/templates.json', 'app/static/templates/merge_templates_v2.py',
+        'app/venv/lib/site.py', 'app/.venv/lib/site.py', 'app/legacy.pyc',
+        'scripts/fix_config.py', 'scripts/restore.py',
+        # The directory rules need a parent, so a top-level venv is kept
+        'venv/pyvenv.cfg',
+    ]:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x', encoding='utf-8')
+    if os.name != 'nt':
+        # Symlinked directories are not followed
+        (root / 'app' / 'linked').symlink_to(root / 'scripts', target_is_directory=True)
+    return root
+
+
+def test_collect_backup_files(source_tree):
+    files, excluded = backup_system.collect_backup_files(source_tree)
+
+    assert sorted(str(path.relative_to(source_tree)).replace('\\', '/') for path in files) == [
+        'README.md',
+        'app/__init__.py',
+        'app/routes/main.py',
+        'app/static/templates/templates.json',
+        'run.py',
+        'scripts/restore.py',
+        'venv/pyvenv.cfg',
+    ]
+    assert excluded == 6
+
+
+def test_collect_backup_files_matches_os_walk(source_tree):
+    assert backup_system.collect_backup_files(source_tree) == collect_backup_files_reference(source_tree)
+
+
+def is_excluded_reference(rel_path, name):
+    """The original list-based exclusion rules."""
+    if any(pattern in rel_path for pattern in ['/.venv/', '/venv/', '/env/', '/.envs/']):
+        return True
+    if '/__pycache__/' in rel_path or rel_path.endswith('/__pycache__'):
+        return True
+    if rel_path.endswith('.pyc') or rel_path.endswith('.pyo'):
+        return True
+    if name in ['.clinerules']:
+        return True
+    dev_scripts = [
+        'debug_', 'test_', 'diagnose_', 'fix_config', 'check_config',
+        'add_templates',
+        'generate_templates', 'merge_templates', 'create_new_templates',
+        'final_merge', 'final_add', 'add_missing', 'add_all_templates'
+    ]
+    return any(script in name.lower() for script in dev_scripts)
+
+
+@pytest.mark.parametrize('rel_path, expected', [
+    ('app/routes/main.py', False),
+    ('app/venv/lib/site.py', True),
+    ('app/.envs/py311/bin/python', True),
+    ('app/environment/settings.py', False),
+    ('app/__pycache__', True),
+    ('app/__pycache__/main.cpython-311.pyc', True),
+    ('app/legacy.pyo', True),
+    ('.clinerules', True),
+    # Dev-script names match anywhere in the lowercased file name
+    ('scripts/My_Test_Runner.py', True),
+    ('scripts/run_debug_upload.py', True),
+    ('scripts/add_missing_covers.py', True),
+    ('test_data/cover.png', False),
+    ('scripts/latest.py', False),
+])
+def test_is_excluded_rel_path(rel_path, expected):
+    name = rel_path.rsplit('/', 1)[-1]
+
+    assert backup_system.is_excluded_rel_path(rel_path, name) is expected
+    assert is_excluded_reference(rel_path, name) is expected
+
+
+def test_is_excluded_rel_path_matches_original_rules():
+    rng = random.Random(0)
+    parts = ['app', 'venv', '.venv', 'env', '.envs', '__pycache__', 'Test_', 'debug_x', 'fix_config',
+             'final_add', 'main.py', 'x.pyc', 'y.pyo', '.clinerules', 'envy', 'static']
+    for _ in range(5000):
+        rel_path = '/'.join(rng.choice(parts) for _ in range(rng.randint(1, 5)))
+        name = rel_path.rsplit('/', 1)[-1]
+        assert backup_system.is_excluded_rel_path(rel_path, name) == is_excluded_reference(rel_path, name)
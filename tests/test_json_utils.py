@@ -0,0 +1,47 @@
+"""
+Unit tests for JSONUtils.save_json_file.
+Saves go through a unique temp file that replaces the target, so a failed
+save leaves the previous contents and no stray temp files behind.
+"""
+import os
+import stat
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.utils import JSONUtils
+
+
+def test_save_round_trips_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / 'history.json')
+
+    assert JSONUtils.save_json_file(path, [{'id': 1}], durable=False)
+    assert JSONUtils.save_json_file(path, [{'id': 2}])
+
+    assert JSONUtils.load_json_file(path) == [{'id': 2}]
+    assert os.listdir(tmp_path) == ['history.json']
+
+
+def test_failed_save_keeps_previous_contents(tmp_path):
+    path = str(tmp_path / 'history.json')
+    JSONUtils.save_json_file(path, [{'id': 1}])
+    circular = []
+    circular.append(circular)
+
+    with pytest.raises(ValueError):
+        JSONUtils.save_json_file(path, circular)
+
+    assert JSONUtils.load_json_file(path) == [{'id': 1}]
+    assert os.listdir(tmp_path) == ['history.json']
+
+
+def test_save_keeps_existing_file_mode(tmp_path):
+    path = tmp_path / 'history.json'
+    path.write_text('[]', encoding='utf-8')
+    os.chmod(path, 0o640)
+
+    assert JSONUtils.save_json_file(str(path), [{'id': 1}])
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
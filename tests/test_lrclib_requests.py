@@ -0,0 +1,77 @@
+"""
+Unit tests for LRCLIB request retries: 5xx and 429 responses are retried,
+transport errors are left to the session's adapter.
+"""
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import lyrics_extraction_service
+from app.services.lyrics_extraction_service import LRCLIBClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(lyrics_extraction_service.time, 'sleep', calls.append)
+    return calls
+
+
+def client_with(outcomes):
+    client = LRCLIBClient()
+    client.session = FakeSession(outcomes)
+    return client
+
+
+def test_not_found_is_a_miss_without_retry(app_context, sleeps):
+    client = client_with([FakeResponse(404)])
+
+    assert client._request_with_retry('https://lrclib.net/api/get') is None
+    assert client.session.calls == 1
+
+
+def test_server_error_is_retried(app_context, sleeps):
+    ok = FakeResponse(200)
+    client = client_with([FakeResponse(503), ok])
+
+    assert client._request_with_retry('https://lrclib.net/api/get') is ok
+    assert sleeps == [0.5]
+
+
+def test_rate_limit_honours_capped_retry_after(app_context, sleeps):
+    ok = FakeResponse(200)
+    client = client_with([FakeResponse(429, {'Retry-After': '2'}), FakeResponse(429, {'Retry-After': '600'}), ok])
+
+    assert client._request_with_retry('https://lrclib.net/api/get') is ok
+    assert sleeps == [2, LRCLIBClient.MAX_RETRY_AFTER_SECONDS]
+
+
+def test_transport_error_is_not_retried_again(app_context, sleeps, caplog):
+    client = client_with([requests.exceptions.ConnectionError('refused')])
+
+    assert client._request_with_retry('https://lrclib.net/api/get') is None
+    assert client.session.calls == 1
+    assert 'after 1 attempt(s)' in caplog.text
@@ -0,0 +1,98 @@
+"""
+Unit tests for LRCLIB candidate scoring: the track-title cutoff and the
+early stop at a perfect match used by search_best_match.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.lyrics_extraction_service import LRCLIBClient
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def candidate(track, artist='Adele', album='25', duration=295, synced=True):
+    return {
+        'trackName': track,
+        'artistName': artist,
+        'albumName': album,
+        'duration': duration,
+        'syncedLyrics': '[00:01.00] Hello' if synced else None,
+    }
+
+
+def test_dissimilar_track_scores_zero_despite_matching_metadata():
+    scored = LRCLIBClient()._score_results(
+        [candidate('Rolling in the Deep')],
+        track_name='Hello', artist_name='Adele', album_name='25', duration=295
+    )
+
+    assert scored[0]['match_score'] == 0.0
+
+
+def test_release_variant_passes_track_cutoff():
+    scored = LRCLIBClient()._score_results(
+        [candidate('Let It Be - Remastered 2009', artist='The Beatles')],
+        track_name='Let It Be', artist_name='The Beatles'
+    )
+
+    assert scored[0]['match_score'] > 0
+
+
+def test_stop_at_perfect_keeps_candidates_up_to_first_perfect_match():
+    results = [
+        candidate('Hello', duration=250),
+        candidate('Hello'),
+        candidate('Hello'),
+    ]
+    client = LRCLIBClient()
+
+    full = client._score_results([dict(r) for r in results], track_name='Hello', artist_name='Adele',
+                                 album_name='25', duration=295)
+    early = client._score_results([dict(r) for r in results], track_name='Hello', artist_name='Adele',
+                                  album_name='25', duration=295, stop_at_perfect=True)
+
+    perfect = (LRCLIBClient.TRACK_WEIGHT + LRCLIBClient.ARTIST_WEIGHT + LRCLIBClient.ALBUM_WEIGHT
+               + LRCLIBClient.DURATION_WEIGHT + LRCLIBClient.SYNCED_LYRICS_BONUS)
+    # The first candidate's duration is 15% off, so it earns no duration points
+    off_duration = perfect - LRCLIBClient.DURATION_WEIGHT
+    assert [r['match_score'] for r in full] == [off_duration, perfect, perfect]
+    assert [r['match_score'] for r in early] == [off_duration, perfect]
+
+
+def test_stop_at_perfect_without_optional_criteria():
+    # Partial credit for missing criteria must still add up to the perfect score
+    results = [candidate('Hello'), candidate('Hello')]
+
+    early = LRCLIBClient()._score_results(results, track_name='Hello', stop_at_perfect=True)
+
+    assert len(early) == 1
+
+
+def test_search_best_match_returns_top_ranked_result(app_context, monkeypatch):
+    payload = [
+        candidate('Hello (Live)', synced=False),
+        candidate('Hello', album='Hello - Single'),
+        candidate('Hello'),
+        candidate('Hello', duration=200),
+    ]
+    client = LRCLIBClient()
+    monkeypatch.setattr(client, '_request_with_retry', lambda url, params=None: FakeResponse(payload))
+
+    ranked = client.search_lyrics('Hello', artist_name='Adele', album_name='25', duration=295)
+    best = client.search_best_match('Hello', artist_name='Adele', album_name='25', duration=295)
+
+    assert best == ranked[0]
+    assert best['albumName'] == '25' and best['duration'] == 295
@@ -0,0 +1,100 @@
+"""
+Unit tests for sharing one LRCLIB search between concurrent lookups of the
+same track.
+"""
+import os
+import sys
+from concurrent.futures import Future
+from threading import Event, Thread
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import lyrics_extraction_service
+from app.services.lyrics_extraction_service import LyricsExtractionServiceEnhanced
+
+MATCH = {'id': 1, 'trackName': 'Hello', 'artistName': 'Adele', 'match_score': 90.0}
+
+
+class WatchedFuture(Future):
+    """Signals when a second caller starts waiting on the search."""
+    waiting = None
+
+    def result(self, timeout=None):
+        WatchedFuture.waiting.set()
+        return super().result(timeout)
+
+
+@pytest.fixture
+def watched_future(monkeypatch):
+    WatchedFuture.waiting = Event()
+    monkeypatch.setattr(lyrics_extraction_service, 'Future', WatchedFuture)
+    return WatchedFuture
+
+
+def run_concurrently(app, service, outcome, searches):
+    """Start a search, join it with a second caller, then finish it with outcome."""
+    started = Event()
+
+    def fake_search(title, artist, album, duration):
+        searches.append(title)
+        started.set()
+        assert WatchedFuture.waiting.wait(timeout=5)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    service._search_lrclib_best_match = fake_search
+    results = {}
+
+    def lookup(name, title):
+        with app.app_context():
+            try:
+                results[name] = service._search_lrclib_best_match_shared(title, 'Adele', None, 295)
+            except Exception as exc:
+                results[name] = exc
+
+    owner = Thread(target=lookup, args=('owner', 'Hello'))
+    owner.start()
+    assert started.wait(timeout=5)
+    # Same track under different casing joins the owner's search
+    waiter = Thread(target=lookup, args=('waiter', 'HELLO'))
+    waiter.start()
+    owner.join(timeout=5)
+    waiter.join(timeout=5)
+    return results
+
+
+def test_concurrent_lookups_share_one_search(app_context, watched_future):
+    service = LyricsExtractionServiceEnhanced()
+    searches = []
+
+    results = run_concurrently(app_context, service, MATCH, searches)
+
+    assert searches == ['Hello']
+    assert results == {'owner': MATCH, 'waiter': MATCH}
+    assert LyricsExtractionServiceEnhanced._inflight_searches == {}
+
+
+def test_search_error_reaches_every_waiter(app_context, watched_future):
+    service = LyricsExtractionServiceEnhanced()
+    searches = []
+    error = RuntimeError('LRCLIB unavailable')
+
+    results = run_concurrently(app_context, service, error, searches)
+
+    assert searches == ['Hello']
+    assert results == {'owner': error, 'waiter': error}
+    assert LyricsExtractionServiceEnhanced._inflight_searches == {}
+
+
+def test_sequential_lookups_search_again(app_context):
+    service = LyricsExtractionServiceEnhanced()
+    searches = []
+    service._search_lrclib_best_match = lambda title, artist, album, duration: searches.append(title) or MATCH
+
+    assert service._search_lrclib_best_match_shared('Hello', 'Adele', None, 295) == MATCH
+    assert service._search_lrclib_best_match_shared('Hello', 'Adele', None, 295) == MATCH
+
+    assert searches == ['Hello', 'Hello']
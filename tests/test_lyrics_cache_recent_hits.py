@@ -0,0 +1,92 @@
+"""
+Unit tests for the in-process copy of recent LRCLIB cache hits.
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import db
+from app.models import LyricsCache
+from app.services.lyrics_extraction_service import LyricsCacheManager
+
+
+@pytest.fixture
+def database(app_context):
+    LyricsCacheManager._recent_hits.clear()
+    db.create_all()
+    yield app_context
+    db.session.remove()
+    db.drop_all()
+    LyricsCacheManager._recent_hits.clear()
+
+
+def add_row(artist, title, lyrics, created_at=None):
+    row = LyricsCache(
+        cache_key=LyricsCacheManager.get_cache_key(artist, title),
+        artist_name=artist,
+        track_name=title,
+        lyrics_text=lyrics,
+    )
+    if created_at is not None:
+        row.created_at = created_at
+    db.session.add(row)
+    db.session.commit()
+    return row
+
+
+def test_hit_is_served_from_memory_until_the_row_changes(database):
+    row = add_row('Adele', 'Hello', 'Hello, it\'s me')
+    assert LyricsCacheManager.get_cached_lyrics('Adele', 'Hello')['source'] == 'lrclib_cache'
+
+    # A write that bypasses cache_lyrics is not seen while the copy is fresh
+    db.session.delete(row)
+    db.session.commit()
+    first = LyricsCacheManager.get_cached_lyrics('Adele', 'Hello')
+    assert first['lyrics'] == 'Hello, it\'s me'
+
+    # Callers get copies, so mutating one does not change the remembered hit
+    first['lyrics'] = 'changed'
+    assert LyricsCacheManager.get_cached_lyrics('Adele', 'Hello')['lyrics'] == 'Hello, it\'s me'
+
+    LyricsCacheManager.cache_lyrics('Adele', 'Hello', 'I was wondering')
+    assert LyricsCacheManager.get_cached_lyrics('Adele', 'Hello')['lyrics'] == 'I was wondering'
+
+
+def test_memory_copy_never_outlives_the_row(database):
+    database.config['LYRICS_CACHE_TTL_DAYS'] = 30
+    add_row('Adele', 'Hello', 'Hello, it\'s me', created_at=datetime.utcnow() - timedelta(days=30, seconds=-5))
+
+    assert LyricsCacheManager.get_cached_lyrics('Adele', 'Hello') is not None
+
+    cache_key = LyricsCacheManager.get_cache_key('Adele', 'Hello')
+    expires_at, _ = LyricsCacheManager._recent_hits[cache_key]
+    assert expires_at <= time.time() + 5
+
+
+def test_least_recently_used_hit_is_evicted(database):
+    database.config['LYRICS_CACHE_MEMORY_SIZE'] = 2
+    for title in ('One', 'Two', 'Three'):
+        add_row('Adele', title, f'{title} lyrics')
+
+    LyricsCacheManager.get_cached_lyrics('Adele', 'One')
+    LyricsCacheManager.get_cached_lyrics('Adele', 'Two')
+    LyricsCacheManager.get_cached_lyrics('Adele', 'One')
+    LyricsCacheManager.get_cached_lyrics('Adele', 'Three')
+
+    assert list(LyricsCacheManager._recent_hits) == [
+        LyricsCacheManager.get_cache_key('Adele', 'One'),
+        LyricsCacheManager.get_cache_key('Adele', 'Three'),
+    ]
+
+
+def test_zero_memory_ttl_disables_the_copy(database):
+    database.config['LYRICS_CACHE_MEMORY_TTL_SECONDS'] = 0
+    add_row('Adele', 'Hello', 'Hello, it\'s me')
+
+    assert LyricsCacheManager.get_cached_lyrics('Adele', 'Hello') is not None
+    assert not LyricsCacheManager._recent_hits
@@ -0,0 +1,134 @@
+"""
+Unit tests for the lyrics extraction service's audio and tag helpers.
+"""
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+from mutagen._vorbis import VComment
+from mutagen.id3 import TIT2, TPE1
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import lyrics_extraction_service
+from app.services.lyrics_extraction_service import LyricsExtractionServiceLegacy
+
+
+@pytest.fixture
+def service():
+    return LyricsExtractionServiceLegacy()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / 'song.mp3'
+    path.write_bytes(b'ID3' + b'\x00' * 1024)
+    return str(path)
+
+
+def test_parsed_audio_is_reused_within_one_extraction_only(app_context, service, audio_file, monkeypatch):
+    app_context.config['LYRICS_RESULT_CACHE_ENABLED'] = False
+    parses = []
+    monkeypatch.setattr(lyrics_extraction_service, 'mutagen_file_loader', lambda path: parses.append(path) or object())
+
+    def fake_run_tiers(self, target_path, temp_dir, whisper_language_override=None):
+        assert self._load_audio_file(target_path) is self._load_audio_file(target_path)
+        return None, None, 'no lyrics'
+
+    monkeypatch.setattr(LyricsExtractionServiceLegacy, '_run_tiers', fake_run_tiers)
+
+    service.extract_lyrics(local_file_path=audio_file)
+    service.extract_lyrics(local_file_path=audio_file)
+
+    assert parses == [audio_file, audio_file]
+    assert service._parsed_audio == (None, None)
+
+
+@pytest.mark.parametrize('url, content_type, expected', [
+    ('https://cdn.example.com/song.mp3', '', '.mp3'),
+    ('https://cdn.example.com/song.FLAC', None, '.flac'),
+    # Presigned URLs carry the extension before the query string
+    ('https://bucket.s3.amazonaws.com/song.m4a?X-Amz-Signature=abc', 'binary/octet-stream', '.m4a'),
+    ('https://cdn.example.com/song.wav#t=10', '', '.wav'),
+    # The URL's extension wins over the content type
+    ('https://cdn.example.com/song.ogg', 'audio/mpeg', '.ogg'),
+    ('https://cdn.example.com/stream', 'audio/mpeg; charset=binary', '.mp3'),
+    ('https://cdn.example.com/stream', 'audio/x-wav', '.wav'),
+    ('https://cdn.example.com/stream', 'audio/x-m4a', '.m4a'),
+    # Unknown subtypes fall back to substring matching
+    ('https://cdn.example.com/stream', 'audio/vnd.wave-mpeg', '.mp3'),
+    ('https://cdn.example.com/song.mp3.html', 'text/html', '.tmp'),
+    ('', '', '.tmp'),
+])
+def test_guess_extension(url, content_type, expected):
+    assert LyricsExtractionServiceLegacy._guess_extension_helper(url, content_type) == expected
+
+
+def vorbis_comments(pairs):
+    comments = VComment()
+    comments.extend(pairs)
+    return comments
+
+
+def test_build_tag_map_groups_vorbis_comments_case_insensitively():
+    comments = vorbis_comments([('ARTIST', 'Sơn Tùng M-TP'), ('artist', 'Snoop Dogg'), ('Title', 'Hãy Trao Cho Anh')])
+
+    tag_map = LyricsExtractionServiceLegacy._build_tag_map(comments)
+
+    assert tag_map == {'artist': ['Sơn Tùng M-TP', 'Snoop Dogg'], 'title': ['Hãy Trao Cho Anh']}
+
+
+def test_build_tag_map_keeps_first_key_per_lowercased_name():
+    tags = {'TPE1': 'Adele', 'tpe1': 'Someone Else', '\xa9nam': 'Hello'}
+
+    assert LyricsExtractionServiceLegacy._build_tag_map(tags) == {'tpe1': 'Adele', '\xa9nam': 'Hello'}
+
+
+@pytest.mark.parametrize('tags, expected', [
+    (vorbis_comments([('ARTIST', '  Adele '), ('TITLE', 'Hello')]), ('Adele', 'Hello')),
+    # An empty lead artist falls through to the album artist
+    (vorbis_comments([('ARTIST', ' '), ('ALBUMARTIST', 'Adele'), ('TITLE', 'Hello')]), ('Adele', 'Hello')),
+    ({'TPE1': TPE1(encoding=3, text=['Adele']), 'TIT2': TIT2(encoding=3, text=['Hello'])}, ('Adele', 'Hello')),
+    ({'\xa9ART': ['Adele'], '\xa9nam': ['Hello']}, ('Adele', 'Hello')),
+])
+def test_extract_artist_title(app_context, service, monkeypatch, tags, expected):
+    audio = SimpleNamespace(tags=tags)
+    monkeypatch.setattr(lyrics_extraction_service, 'mutagen_file_loader', lambda path: audio)
+
+    assert service._extract_artist_title('song.flac') == expected
+
+
+def dedupe_ngrams_reference(words, n):
+    """The original tuple-per-window implementation."""
+    if len(words) < n * 2:
+        return ' '.join(words)
+    output = []
+    seen_ngrams = set()
+    i = 0
+    while i < len(words):
+        if i + n <= len(words):
+            ngram = tuple(words[i:i + n])
+            if ngram in seen_ngrams:
+                i += n
+                continue
+            seen_ngrams.add(ngram)
+        output.append(words[i])
+        i += 1
+    return ' '.join(output)
+
+
+def test_dedupe_rolling_ngrams_drops_repeated_phrases():
+    words = 'i love you so i love you so much'.split()
+
+    # The repeated trigram 'i love you' is skipped whole; 'so' survives as a new window
+    assert LyricsExtractionServiceLegacy._dedupe_rolling_ngrams(words, n=3) == 'i love you so so much'
+
+
+@pytest.mark.parametrize('n', [2, 3, 4])
+def test_dedupe_rolling_ngrams_matches_reference(n):
+    rng = random.Random(n)
+    for _ in range(2000):
+        words = [rng.choice('abcde') for _ in range(rng.randint(0, 30))]
+        assert LyricsExtractionServiceLegacy._dedupe_rolling_ngrams(words, n=n) == dedupe_ngrams_reference(words, n)
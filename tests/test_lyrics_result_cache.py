@@ -0,0 +1,76 @@
+"""
+Unit tests for the in-process lyrics result cache.
+Successful extractions are reused; misses must never be cached so retries re-run the tiers.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.lyrics_extraction_service import (
+    LyricsExtractionServiceLegacy,
+    LyricsResultCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    LyricsResultCache._entries.clear()
+    yield
+    LyricsResultCache._entries.clear()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / 'song.mp3'
+    path.write_bytes(b'ID3' + b'\x00' * 1024)
+    return str(path)
+
+
+def test_miss_is_not_cached(app_context):
+    LyricsResultCache.set('key', (None, None, 'AssemblyAI request failed'))
+    assert LyricsResultCache.get('key') is None
+
+
+def test_hit_is_cached(app_context):
+    result = ('la la la', 'lrclib', None)
+    LyricsResultCache.set('key', result)
+    assert LyricsResultCache.get('key') == result
+
+
+def test_retry_after_transient_failure_reruns_tiers(app_context, audio_file, monkeypatch):
+    outcomes = [(None, None, 'timeout'), ('la la la', 'assemblyai', None)]
+    calls = []
+
+    def fake_run_tiers(self, target_path, temp_dir, whisper_language_override=None):
+        calls.append(target_path)
+        return outcomes[len(calls) - 1]
+
+    monkeypatch.setattr(LyricsExtractionServiceLegacy, '_run_tiers', fake_run_tiers)
+    service = LyricsExtractionServiceLegacy()
+
+    assert service.extract_lyrics(local_file_path=audio_file) == (None, None, 'timeout')
+    assert service.extract_lyrics(local_file_path=audio_file) == ('la la la', 'assemblyai', None)
+    # The success is now served from the cache without another tier run
+    assert service.extract_lyrics(local_file_path=audio_file) == ('la la la', 'assemblyai', None)
+    assert len(calls) == 2
+
+
+def test_key_is_not_built_when_cache_is_disabled(app_context, audio_file, monkeypatch):
+    app_context.config['LYRICS_RESULT_CACHE_ENABLED'] = False
+
+    def fail(*args, **kwargs):
+        raise AssertionError('audio file read with the cache disabled')
+
+    monkeypatch.setattr(os.path, 'getsize', fail)
+    assert LyricsResultCache.make_key(audio_file, 'vi') is None
+
+
+def test_key_changes_with_output_shaping_settings(app_context, audio_file):
+    key = LyricsResultCache.make_key(audio_file, 'vi')
+    assert LyricsResultCache.make_key(audio_file, 'vi') == key
+
+    app_context.config['LYRICS_VI_CUSTOM_CORRECTIONS_JSON'] = '{"dong noi": "giọng nói"}'
+    assert LyricsResultCache.make_key(audio_file, 'vi') != key
@@ -0,0 +1,50 @@
+"""
+Unit tests for the transcription text filters in the lyrics extraction service.
+Expected outputs are those of the original one-pattern-at-a-time substitutions.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.lyrics_extraction_service import LyricsExtractionServiceLegacy
+
+
+@pytest.fixture
+def service():
+    return LyricsExtractionServiceLegacy()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Em yêu anh. Hãy subscribe cho kênh nhé.', 'Em yêu anh.'),
+    ('la la [Music] la la ♪ hum ♪', 'la la la la'),
+    ('Thanks for watching! Please subscribe.', ''),
+    # An earlier pattern consumes text a later pattern would have matched first
+    ('to my channel. [Music] nhấn like Hãy subscribe to my channel. kênh', 'to my channel.'),
+    ('hit the bell cảm ơn các bạn đã xem . la la .', ''),
+    ("em yêu anh. video [intro video don't forget to like [Music] outro", 'em yêu anh. video [intro video'),
+    ('hit the bell please subscribe video em yêu anh. ♪ em yêu anh.', ''),
+])
+def test_filter_hallucinations(service, text, expected):
+    assert service._filter_hallucinations(text) == expected
+
+
+@pytest.mark.parametrize('custom, text, expected', [
+    ({}, 'Lời bay hát  của dong noi', 'lời bài hát của giọng nói'),
+    ({}, 'hệ thống nhận dạng dọng nói\n\n\n\nxong', 'hệ thống nhận dạng giọng nói\n\nxong'),
+    # Custom corrections see the built-in fixes' output
+    ({'giọng nói hay': 'giọng hát hay'}, 'dọng nói hay', 'giọng hát hay'),
+    # Custom corrections run in config order, each on the previous output
+    ({'a': 'b', 'b': 'c'}, 'a b', 'c c'),
+    ({'ab': 'X', 'abc': 'Y'}, 'abc', 'Xc'),
+])
+def test_vietnamese_corrections(app_context, service, custom, text, expected):
+    app_context.config['LYRICS_VI_CUSTOM_CORRECTIONS_JSON'] = json.dumps(custom) if custom else ''
+    assert service._apply_language_post_corrections(text, 'vi') == expected
+
+
+def test_vietnamese_corrections_skip_other_languages(app_context, service):
+    assert service._apply_language_post_corrections('dọng  nói', 'en') == 'dọng  nói'
@@ -0,0 +1,110 @@
+"""
+Unit tests for the template indexes shared across TemplateService instances.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.template_service import TemplateService
+
+TEMPLATES = [
+    {'id': 'lofi', 'name': 'Lo-Fi Study', 'description': 'Mellow beats', 'style': 'lofi hip hop',
+     'category': 'Chill', 'subcategory': 'Study', 'tags': ['Relax', 'Focus'], 'popularity': 90},
+    {'id': 'edm', 'name': 'Festival Drop', 'description': 'Big room energy', 'style': 'edm',
+     'category': 'Dance', 'subcategory': 'Festival', 'tags': ['Party'], 'popularity': 70},
+    {'id': 'ambient', 'name': 'Deep Space', 'description': 'Slow drones', 'style': 'ambient',
+     'category': 'Chill', 'subcategory': 'Sleep', 'tags': ['relax'], 'popularity': 40},
+    # Duplicate ids resolve to the first template, as a linear scan would
+    {'id': 'lofi', 'name': 'Lo-Fi Copy', 'category': 'Chill', 'popularity': 0},
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_shared_entries():
+    TemplateService._shared_entries.clear()
+    yield
+    TemplateService._shared_entries.clear()
+
+
+@pytest.fixture
+def templates_file(tmp_path):
+    path = tmp_path / 'templates.json'
+    path.write_text(json.dumps({'templates': TEMPLATES}), encoding='utf-8')
+    return path
+
+
+def make_service(templates_file):
+    service = TemplateService()
+    service.templates_file = str(templates_file)
+    return service
+
+
+def test_instances_share_templates_and_indexes(templates_file):
+    first = make_service(templates_file)
+    second = make_service(templates_file)
+
+    assert first.get_all_templates() is second.get_all_templates()
+    assert first._get_index('lookup') is second._get_index('lookup')
+
+
+def test_lookup_index(templates_file):
+    service = make_service(templates_file)
+
+    assert service.get_template_by_id('lofi')['name'] == 'Lo-Fi Study'
+    assert service.get_template_by_id('missing') is None
+    assert service.get_categories() == ['Chill', 'Dance']
+    assert service.get_subcategories() == ['Festival', 'Sleep', 'Study']
+    assert service.get_subcategories('Chill') == ['Sleep', 'Study']
+    assert service.get_tags() == ['Focus', 'Party', 'Relax', 'relax']
+    assert service.get_template_stats() == {
+        'total_count': 4,
+        'category_counts': {'Chill': 3, 'Dance': 1},
+        'avg_popularity': 50,
+    }
+
+
+def test_search_matches_any_field_case_insensitively(templates_file):
+    service = make_service(templates_file)
+
+    assert [t['name'] for t in service.search_templates('LO-FI')] == ['Lo-Fi Study', 'Lo-Fi Copy']
+    assert [t['id'] for t in service.search_templates('room')] == ['edm']
+    assert [t['id'] for t in service.search_templates('focus')] == ['lofi']
+    # A match may not run from one field into the next
+    assert service.search_templates('studymellow') == []
+    assert service.search_templates('study\x1fmellow') == []
+
+
+def test_filter_by_category_and_tags(templates_file):
+    service = make_service(templates_file)
+
+    assert [t['id'] for t in service.filter_templates(category='Chill', tags=['RELAX'])] == ['lofi', 'ambient']
+    assert [t['id'] for t in service.filter_templates(category='Chill', min_popularity=50)] == ['lofi']
+    assert service.filter_templates(category='Rock') == []
+
+
+def test_changed_file_is_reloaded(templates_file):
+    service = make_service(templates_file)
+    assert service.get_template_by_id('edm') is not None
+
+    templates_file.write_text(json.dumps({'templates': TEMPLATES[:1]}), encoding='utf-8')
+    stat = templates_file.stat()
+    os.utime(templates_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # A new instance (the next request) picks up the new file and its indexes
+    fresh = make_service(templates_file)
+    assert fresh.get_template_by_id('edm') is None
+    assert fresh.get_categories() == ['Chill']
+
+
+def test_clear_cache_drops_the_shared_entry(templates_file):
+    service = make_service(templates_file)
+    service.get_categories()
+
+    service.clear_cache()
+
+    assert str(templates_file) not in TemplateService._shared_entries
+    assert service.get_categories() == ['Chill', 'Dance']
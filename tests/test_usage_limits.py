@@ -0,0 +1,61 @@
+"""
+Unit tests for the usage window sums behind the free-tier limits.
+"""
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import db
+from app.models import UsageEvent
+from app.services.usage_limits import _usage_sums, _window_start_daily, _window_start_monthly
+
+NOW = datetime(2026, 10, 16, 12, 0, 0)
+DAY_START = _window_start_daily(NOW)
+MONTH_START = _window_start_monthly(NOW)
+
+
+@pytest.fixture
+def database(app_context):
+    db.create_all()
+    yield db
+    db.session.remove()
+    db.drop_all()
+
+
+def add_event(created_at, units, user_id=None, ip_address=None):
+    event = UsageEvent('generate', user_id=user_id, ip_address=ip_address, units=units)
+    event.created_at = created_at
+    db.session.add(event)
+
+
+def test_no_events_sum_to_zero(database):
+    assert _usage_sums(user_id=None, ip_address='1.2.3.4', day_start=DAY_START, month_start=MONTH_START) == (0, 0)
+
+
+def test_anonymous_sums_are_scoped_to_ip_and_windows(database):
+    user_id = str(uuid.uuid4())
+    add_event(DAY_START, 2, ip_address='1.2.3.4')
+    add_event(NOW, 1, ip_address='1.2.3.4')
+    add_event(DAY_START - timedelta(seconds=1), 3, ip_address='1.2.3.4')
+    add_event(MONTH_START - timedelta(seconds=1), 5, ip_address='1.2.3.4')
+    add_event(NOW, 7, ip_address='5.6.7.8')
+    add_event(NOW, 11, user_id=user_id, ip_address='1.2.3.4')
+    db.session.commit()
+
+    assert _usage_sums(user_id=None, ip_address='1.2.3.4', day_start=DAY_START, month_start=MONTH_START) == (3, 6)
+
+
+def test_user_sums_ignore_ip_and_other_users(database):
+    user_id = str(uuid.uuid4())
+    add_event(NOW, 1, user_id=user_id, ip_address='1.2.3.4')
+    add_event(MONTH_START, 4, user_id=user_id, ip_address='5.6.7.8')
+    add_event(NOW, 7, user_id=str(uuid.uuid4()))
+    add_event(NOW, 11, ip_address='1.2.3.4')
+    db.session.commit()
+
+    assert _usage_sums(user_id=user_id, ip_address=None, day_start=DAY_START, month_start=MONTH_START) == (1, 5)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the Demucs vocal separation wrapper.
+"""
+import logging
+import os
+import sys
+from collections import deque
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import lyrics_extraction_service
+from app.services.lyrics_extraction_service import LyricsExtractionServiceLegacy
+
+# Progress bars are \r-terminated, so the whole run is one stderr "line"
+FAILING_DEMUCS = '''#!/bin/sh
+i=0
+while [ $i -lt 5000 ]; do
+    printf '\\r%d%%|#####     | 12.0/60.0 [00:01<00:04, 10.0seconds/s]' $i >&2
+    i=$((i + 1))
+done
+printf '\\nRuntimeError: model weights not found\\n' >&2
+exit 2
+'''
+
+
+class RecordingDeque(deque):
+    """Tracks the most bytes the stderr tail ever held."""
+    peak_bytes = 0
+
+    def append(self, item):
+        super().append(item)
+        RecordingDeque.peak_bytes = max(RecordingDeque.peak_bytes, sum(map(len, self)))
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='the stand-in demucs is a POSIX shell script')
+def test_failed_run_logs_the_stderr_tail(app_context, tmp_path, monkeypatch, caplog):
+    (tmp_path / 'bin').mkdir()
+    demucs = tmp_path / 'bin' / 'demucs'
+    demucs.write_text(FAILING_DEMUCS, encoding='utf-8')
+    demucs.chmod(0o755)
+    monkeypatch.setattr(lyrics_extraction_service.shutil, 'which', lambda name: str(demucs))
+    monkeypatch.setattr(lyrics_extraction_service, 'deque', RecordingDeque)
+    RecordingDeque.peak_bytes = 0
+    service = LyricsExtractionServiceLegacy()
+
+    with caplog.at_level(logging.INFO):
+        assert service._separate_vocals_with_demucs(str(tmp_path / 'song.mp3'), str(tmp_path)) is None
+
+    assert 'Demucs failed (2)' in caplog.text
+    assert 'model weights not found' in caplog.text
+    # Over 300 KB of progress output, but the tail stays bounded
+    bound = lyrics_extraction_service._STDERR_TAIL_CHUNKS * lyrics_extraction_service._STDERR_TAIL_CHUNK_SIZE
+    assert 0 < RecordingDeque.peak_bytes <= bound